@@ -339,7 +339,7 @@ print(f"   - Toutes les allées: minimum 4 cases de large pour navigation optima
 
 # Count cell types for verification
 unique, counts = np.unique(layout, return_counts=True)
-cell_stats = dict(zip(unique, counts))
+cell_stats = dict(zip(unique.tolist(), counts.tolist()))
 print(f"📊 Statistiques des cellules:")
 for cell_type, count in cell_stats.items():
     if cell_type == 0:
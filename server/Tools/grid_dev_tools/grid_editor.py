@@ -22,34 +22,48 @@ Controls (new):
 
 import pygame
 import numpy as np
-import h5py
 import sys
 import os
 from typing import Tuple, Optional, List
-import tkinter as tk
-from tkinter import filedialog, messagebox, simpledialog
 import json
 import time
 
-# Pathfinding imports (kept as before)
-try:
-    sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-    from api_navimall.path_optimization.pathfinding_solver import (
-        PathfindingSolver,
-        PathfindingSolverFactory,
-    )
-    from api_navimall.path_optimization.utils import (
-        load_layout_from_h5,
-        save_layout_to_h5,
-        save_grid_with_metadata,
-        calculate_layout_hash,
-        Zone,
-    )
-
-    PATHFINDING_AVAILABLE = True
-except ImportError as e:
-    PATHFINDING_AVAILABLE = False
-    print(f"⚠️ Pathfinding not available: {e}")
+# tkinter, h5py and the pathfinding stack (h5py, xxhash, pathfinding) are
+# imported on first use so the editor window opens without paying for them.
+PATHFINDING_AVAILABLE: Optional[bool] = None  # resolved by _ensure_pathfinding()
+
+
+def _ensure_pathfinding() -> bool:
+    """Import the api_navimall pathfinding helpers once and report availability."""
+    global PATHFINDING_AVAILABLE, PathfindingSolverFactory
+    global load_layout_from_h5, save_layout_to_h5, calculate_layout_hash
+    if PATHFINDING_AVAILABLE is None:
+        try:
+            sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
+            from api_navimall.path_optimization.pathfinding_solver import (
+                PathfindingSolverFactory,
+            )
+            from api_navimall.path_optimization.utils import (
+                load_layout_from_h5,
+                save_layout_to_h5,
+                calculate_layout_hash,
+            )
+
+            PATHFINDING_AVAILABLE = True
+        except ImportError as e:
+            PATHFINDING_AVAILABLE = False
+            print(f"⚠️ Pathfinding not available: {e}")
+    return PATHFINDING_AVAILABLE
+
+
+def _json_default(obj):
+    """json.dump hook: only called for values json can't serialize (NumPy types)."""
+    if isinstance(obj, (np.integer, np.floating)):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
 
 # Color configuration -- re-used
 COLORS = {
@@ -72,12 +86,31 @@ COLORS = {
     "path_line": (255, 0, 0),  # Changed to red
 }
 
+# Cell colors indexed by cell value + 1 (-1=obstacle, 0=free, 1=POI, 2=shelf)
+CELL_COLOR = (COLORS["obstacle"], COLORS["navigable"], COLORS["poi"], COLORS["shelf"])
+
 # Defaults
 DEFAULT_GRID_SIZE = (20, 15)
 DEFAULT_CELL_SIZE = 25
 DEFAULT_EDGE_LENGTH = 100.0  # cm
+GRID_DTYPE = np.int8  # cell values fit in -1..2
 MIN_CELL_SIZE = 6
 MAX_CELL_SIZE = 120
+ACTIVE_FPS = 60
+IDLE_FPS = 30  # frame cap once no input has been received for IDLE_DELAY_MS
+IDLE_DELAY_MS = 1000
+
+# Only these events are queued; everything else is dropped by SDL
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.VIDEORESIZE,
+]
 
 
 class GridEditor:
@@ -121,6 +154,10 @@ class GridEditor:
             (self.screen_width, self.screen_height), pygame.RESIZABLE
         )
         pygame.display.set_caption("NaviStore Grid Editor — Modern UI")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+        self._clock = pygame.time.Clock()
+        self._last_input_ms = pygame.time.get_ticks()
 
         # Fonts
         self.font = pygame.font.Font(None, 22)
@@ -128,10 +165,18 @@ class GridEditor:
         self.tiny_font = pygame.font.Font(None, 14)
 
         # Model (grid state)
-        self.grid = np.zeros((self.grid_height, self.grid_width), dtype=int)
+        self.grid = np.zeros((self.grid_height, self.grid_width), dtype=GRID_DTYPE)
         self.original_grid = None
         self.has_changes = False
         self.zones = []
+        # Values derived from the grid, cleared by _invalidate_grid_caches()
+        self._layout_hash_cache: Optional[str] = None
+        self._walkable: Optional[np.ndarray] = None
+        # Offscreen copy of the visible cells; edited cells are repainted
+        # through _dirty_cells instead of redrawing the whole grid
+        self._grid_surface: Optional[pygame.Surface] = None
+        self._grid_surface_key = None
+        self._dirty_cells: set = set()
 
         # Viewport / camera state
         # offset is pixel position of the grid's top-left on screen
@@ -149,6 +194,9 @@ class GridEditor:
 
         # Dragging state: which tool is currently being applied while mouse held
         self.drag_tool: Optional[int] = None
+        # Last cell painted during the current drag (motion events within the
+        # same cell are ignored)
+        self._last_drag_cell: Optional[Tuple[int, int]] = None
 
         # Panning (middle mouse)
         self.panning = False
@@ -169,6 +217,11 @@ class GridEditor:
         self.computed_path = None
         self.path_stats = None
         self.pathfinding_step = 0
+        # Path/start/goal are rendered once onto a transparent overlay which is
+        # only rebuilt when the path or the visible grid geometry changes
+        self._path_version = 0
+        self._path_overlay: Optional[pygame.Surface] = None
+        self._path_overlay_key = None
 
         # Stats
         self.stats = {"navigable": 0, "obstacles": 0, "pois": 0, "shelves": 0}
@@ -178,6 +231,14 @@ class GridEditor:
         self.open_dropdown = None  # None or one of menu names
         self.infos_visible = True  # grouped "Infos" panel visibility
 
+        # Cached panel/palette rectangles, rebuilt only when the geometry key
+        # (window size, viewport, grid size, open dropdown) changes
+        self._layout: dict = {}
+        self._layout_key = None
+
+        # Hidden Tk root shared by every dialog (created on first use)
+        self._tk_root = None
+
         # Dropdown definitions: each is list of (label, callback, shortcut)
         self.dropdowns = {
             "Fichier": [
@@ -223,17 +284,39 @@ class GridEditor:
 
     # ------------------------- Model utilities -------------------------
     def _update_stats(self):
-        unique, counts = np.unique(self.grid, return_counts=True)
-        stats_dict = dict(zip(unique, counts))
+        # Cell values are -1..2: one linear counting pass on value + 1 (no sort
+        # as with np.unique); tolist() gives native Python ints. Values outside
+        # that range (unvalidated fallback load) are not counted
+        cells = self.grid.ravel() + 1
+        obstacles, navigable, pois, shelves = np.bincount(
+            cells[(cells >= 0) & (cells < 4)], minlength=4
+        ).tolist()
         self.stats = {
-            "navigable": int(stats_dict.get(0, 0)),
-            "obstacles": int(stats_dict.get(-1, 0)),
-            "pois": int(stats_dict.get(1, 0)),
-            "shelves": int(stats_dict.get(2, 0)),
+            "navigable": navigable,
+            "obstacles": obstacles,
+            "pois": pois,
+            "shelves": shelves,
         }
 
+    def _invalidate_grid_caches(self, cells=None):
+        """Drop values derived from the grid; call after any grid/edge length change.
+
+        ``cells`` lists the (row, col) cells that were edited; without it the
+        whole grid surface is rebuilt on the next frame.
+        """
+        self._layout_hash_cache = None
+        self._walkable = None
+        if cells is None:
+            self._grid_surface_key = None
+            self._dirty_cells.clear()
+        else:
+            self._dirty_cells.update(cells)
+
     def _calculate_layout_hash(self) -> str:
-        return calculate_layout_hash(self.grid, self.edge_length)
+        if self._layout_hash_cache is None:
+            _ensure_pathfinding()
+            self._layout_hash_cache = calculate_layout_hash(self.grid, self.edge_length)
+        return self._layout_hash_cache
 
     def _calculate_world_coordinates(
         self, grid_x: int, grid_y: int
@@ -300,202 +383,255 @@ class GridEditor:
         )
 
     # ------------------------- File operations (unchanged logic) -------------------------
+    def _get_tk_root(self):
+        """Return the hidden Tk root used as dialog parent, creating it once."""
+        if self._tk_root is None:
+            import tkinter as tk
+
+            self._tk_root = tk.Tk()
+            self._tk_root.withdraw()
+        return self._tk_root
+
+    def _destroy_tk_root(self):
+        if self._tk_root is not None:
+            self._tk_root.destroy()
+            self._tk_root = None
+
     def _new_grid(self):
+        from tkinter import simpledialog
+
         if self.has_changes:
             if not self._confirm_action(
                 "Créer une nouvelle grille? Les modifications non sauvées seront perdues."
             ):
                 return
 
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            width = simpledialog.askinteger(
-                "Nouvelle grille",
-                "Largeur:",
-                initialvalue=self.grid_width,
-                minvalue=5,
-                maxvalue=500,
-            )
-            if width is None:
-                return
-            height = simpledialog.askinteger(
-                "Nouvelle grille",
-                "Hauteur:",
-                initialvalue=self.grid_height,
-                minvalue=5,
-                maxvalue=500,
-            )
-            if height is None:
-                return
-            edge_length = simpledialog.askfloat(
-                "Nouvelle grille",
-                "Taille cellule (cm):",
-                initialvalue=self.edge_length,
-                minvalue=10.0,
-                maxvalue=500.0,
-            )
-            if edge_length is None:
-                return
-            self.grid_width, self.grid_height = width, height
-            self.edge_length = edge_length
-            self.grid = np.zeros((self.grid_height, self.grid_width), dtype=int)
-            self.original_grid = None
-            self.has_changes = False
-            self._update_stats()
-            self._fit_grid_to_view()
-        finally:
-            root.destroy()
+        root = self._get_tk_root()
+        width = simpledialog.askinteger(
+            "Nouvelle grille",
+            "Largeur:",
+            initialvalue=self.grid_width,
+            minvalue=5,
+            maxvalue=500,
+            parent=root,
+        )
+        if width is None:
+            return
+        height = simpledialog.askinteger(
+            "Nouvelle grille",
+            "Hauteur:",
+            initialvalue=self.grid_height,
+            minvalue=5,
+            maxvalue=500,
+            parent=root,
+        )
+        if height is None:
+            return
+        edge_length = simpledialog.askfloat(
+            "Nouvelle grille",
+            "Taille cellule (cm):",
+            initialvalue=self.edge_length,
+            minvalue=10.0,
+            maxvalue=500.0,
+            parent=root,
+        )
+        if edge_length is None:
+            return
+        self.grid_width, self.grid_height = width, height
+        self.edge_length = edge_length
+        self.grid = np.zeros((self.grid_height, self.grid_width), dtype=GRID_DTYPE)
+        self.original_grid = None
+        self.has_changes = False
+        self._invalidate_grid_caches()
+        self._update_stats()
+        self._fit_grid_to_view()
 
     def _load_grid(self):
+        import h5py
+        from tkinter import filedialog, messagebox
+
         if self.has_changes:
             if not self._confirm_action(
                 "Charger une grille? Les modifications non sauvées seront perdues."
             ):
                 return
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            file_path = filedialog.askopenfilename(
-                title="Charger grille",
-                filetypes=[("Fichiers HDF5", "*.h5"), ("Tous fichiers", "*.*")],
-            )
-            if not file_path:
-                return
-            if PATHFINDING_AVAILABLE:
-                layout, edge_length, zones_dict = load_layout_from_h5(file_path)
-                self.zones = list(zones_dict.values())
-            else:
-                with h5py.File(file_path, "r") as f:
-                    layout = np.array(f["layout"])
-                    edge_length = float(f["edge_length"][()])
-                self.zones = []
+        root = self._get_tk_root()
+        file_path = filedialog.askopenfilename(
+            title="Charger grille",
+            filetypes=[("Fichiers HDF5", "*.h5"), ("Tous fichiers", "*.*")],
+            parent=root,
+        )
+        if not file_path:
+            return
+        if _ensure_pathfinding():
+            layout, edge_length, zones_dict = load_layout_from_h5(file_path)
+            self.zones = list(zones_dict.values())
+        else:
             with h5py.File(file_path, "r") as f:
-                stored_hash = f.attrs.get("layout_hash", "Non disponible")
-                self.grid = layout
-                self.grid_height, self.grid_width = layout.shape
-                self.edge_length = edge_length
-                self.original_grid = layout.copy()
-                self.has_changes = False
-                self._update_stats()
-                current_hash = self._calculate_layout_hash()
-                filename = os.path.basename(file_path)
-                info_message = f"Grille chargée: {self.grid_width}x{self.grid_height}\nFichier: {filename}\nHash XXH3: {current_hash}\n"
-                if stored_hash != "Non disponible":
-                    if stored_hash == current_hash:
-                        info_message += "✓ Intégrité vérifiée"
-                    else:
-                        info_message += f"⚠ Hash différent du stocké: {stored_hash}"
+                # Read straight into an int8 buffer (HDF5 converts the type)
+                layout_ds = f["layout"]
+                layout = np.empty(layout_ds.shape, dtype=GRID_DTYPE)
+                layout_ds.read_direct(layout)
+                edge_length = float(f["edge_length"][()])
+            self.zones = []
+        with h5py.File(file_path, "r") as f:
+            stored_hash = f.attrs.get("layout_hash", "Non disponible")
+            self.grid = layout.astype(GRID_DTYPE, copy=False)
+            self.grid_height, self.grid_width = layout.shape
+            self.edge_length = edge_length
+            self.original_grid = self.grid.copy()
+            self.has_changes = False
+            self._invalidate_grid_caches()
+            self._update_stats()
+            current_hash = self._calculate_layout_hash()
+            filename = os.path.basename(file_path)
+            info_message = f"Grille chargée: {self.grid_width}x{self.grid_height}\nFichier: {filename}\nHash XXH3: {current_hash}\n"
+            if stored_hash != "Non disponible":
+                if stored_hash == current_hash:
+                    info_message += "✓ Intégrité vérifiée"
                 else:
-                    info_message += "ℹ Pas de hash stocké (fichier ancien)"
-                    messagebox.showinfo("Succès", info_message)
-                    self._fit_grid_to_view()
-        finally:
-            root.destroy()
+                    info_message += f"⚠ Hash différent du stocké: {stored_hash}"
+            else:
+                info_message += "ℹ Pas de hash stocké (fichier ancien)"
+                messagebox.showinfo("Succès", info_message, parent=root)
+                self._fit_grid_to_view()
 
     def _save_grid(self):
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            layout_hash = self._calculate_layout_hash()
-            save_dir = filedialog.askdirectory(
-                title="Choisir le répertoire de sauvegarde"
-            )
-            if not save_dir:
+        import h5py
+        from tkinter import filedialog, messagebox
+
+        root = self._get_tk_root()
+        layout_hash = self._calculate_layout_hash()
+        save_dir = filedialog.askdirectory(
+            title="Choisir le répertoire de sauvegarde", parent=root
+        )
+        if not save_dir:
+            return
+        file_path = os.path.join(save_dir, f"{layout_hash}.h5")
+        if os.path.exists(file_path):
+            if not messagebox.askyesno(
+                "Fichier existant",
+                f"Le fichier {layout_hash}.h5 existe déjà. Voulez-vous l'écraser?",
+                parent=root,
+            ):
                 return
-            file_path = os.path.join(save_dir, f"{layout_hash}.h5")
-            if os.path.exists(file_path):
-                if not messagebox.askyesno(
-                    "Fichier existant",
-                    f"Le fichier {layout_hash}.h5 existe déjà. Voulez-vous l'écraser?",
-                ):
-                    return
-            if PATHFINDING_AVAILABLE:
-                zones_dict = {f"zone_{i}": zone for i, zone in enumerate(self.zones)}
-                save_layout_to_h5(file_path, self.grid, self.edge_length, zones_dict)
-                with h5py.File(file_path, "a") as f:
-                    f.attrs["layout_hash"] = layout_hash
-                    f.attrs["created_with"] = "NaviStore Grid Editor"
-            else:
-                with h5py.File(file_path, "w") as f:
-                    f.create_dataset("layout", data=self.grid)
-                    f.create_dataset("edge_length", data=self.edge_length)
-                    f.attrs["layout_hash"] = layout_hash
-                    f.attrs["created_with"] = "NaviStore Grid Editor"
-            self.original_grid = self.grid.copy()
-            self.has_changes = False
-            # metadata
-            metadata_file = os.path.join(save_dir, f"{layout_hash}_metadata.json")
-            metadata = {
-                "layout_hash": layout_hash,
-                "grid_shape": [int(self.grid.shape[0]), int(self.grid.shape[1])],
-                "edge_length": float(self.edge_length),
-                "statistics": self.stats,
-                "file_path": file_path,
-                "created_with": "NaviStore Grid Editor",
-            }
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
-            messagebox.showinfo(
-                "Succès",
-                f"Grille sauvegardée: Nom: {layout_hash}.h5 Chemin: {file_path}",
+        if _ensure_pathfinding():
+            zones_dict = {f"zone_{i}": zone for i, zone in enumerate(self.zones)}
+            save_layout_to_h5(
+                file_path,
+                self.grid,
+                self.edge_length,
+                zones_dict,
+                attrs={
+                    "layout_hash": layout_hash,
+                    "created_with": "NaviStore Grid Editor",
+                },
             )
-        finally:
-            root.destroy()
+        else:
+            with h5py.File(
+                file_path,
+                "w",
+                libver="latest",
+                rdcc_nbytes=4 * 1024 * 1024,
+                rdcc_nslots=521,
+            ) as f:
+                f.create_dataset(
+                    "layout",
+                    data=self.grid,
+                    chunks=(min(256, self.grid_height), min(256, self.grid_width)),
+                    compression="lzf",
+                    shuffle=True,
+                )
+                f.create_dataset("edge_length", data=self.edge_length)
+                f.attrs["layout_hash"] = layout_hash
+                f.attrs["created_with"] = "NaviStore Grid Editor"
+        self.original_grid = self.grid.copy()
+        self.has_changes = False
+        # metadata
+        metadata_file = os.path.join(save_dir, f"{layout_hash}_metadata.json")
+        metadata = {
+            "layout_hash": layout_hash,
+            "grid_shape": self.grid.shape,
+            "edge_length": self.edge_length,
+            "statistics": self.stats,
+            "file_path": file_path,
+            "created_with": "NaviStore Grid Editor",
+        }
+        with open(metadata_file, "w") as f:
+            json.dump(metadata, f, indent=2, default=_json_default)
+        messagebox.showinfo(
+            "Succès",
+            f"Grille sauvegardée: Nom: {layout_hash}.h5 Chemin: {file_path}",
+            parent=root,
+        )
 
     def _reset_grid(self):
         if self.original_grid is not None:
             if self._confirm_action("Annuler toutes les modifications?"):
-                self.grid = self.original_grid.copy()
+                if self.grid.shape != self.original_grid.shape:
+                    # Grid was resized since load/save: restore it entirely
+                    self.grid = self.original_grid.copy()
+                    self.grid_height, self.grid_width = self.grid.shape
+                    self._fit_grid_to_view()
+                else:
+                    # Only write back the cells that were edited
+                    diff = self.grid != self.original_grid
+                    if not diff.any():
+                        self.has_changes = False
+                        return
+                    self.grid[diff] = self.original_grid[diff]
                 self.has_changes = False
+                self._invalidate_grid_caches()
                 self._update_stats()
         else:
             if self._confirm_action("Effacer toute la grille?"):
                 self.grid.fill(0)
                 self.has_changes = True
+                self._invalidate_grid_caches()
                 self._update_stats()
 
     def _resize_grid(self):
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            width = simpledialog.askinteger(
-                "Redimensionner",
-                "Nouvelle largeur:",
-                initialvalue=self.grid_width,
-                minvalue=5,
-                maxvalue=500,
-            )
-            if width is None:
-                return
-            height = simpledialog.askinteger(
-                "Redimensionner",
-                "Nouvelle hauteur:",
-                initialvalue=self.grid_height,
-                minvalue=5,
-                maxvalue=500,
-            )
-            if height is None:
-                return
-            new_grid = np.zeros((height, width), dtype=int)
-            copy_height = min(self.grid_height, height)
-            copy_width = min(self.grid_width, width)
-            new_grid[:copy_height, :copy_width] = self.grid[:copy_height, :copy_width]
-            self.grid = new_grid
-            self.grid_width, self.grid_height = width, height
-            self.has_changes = True
-            self._update_stats()
-            self._fit_grid_to_view()
-        finally:
-            root.destroy()
+        from tkinter import simpledialog
+
+        root = self._get_tk_root()
+        width = simpledialog.askinteger(
+            "Redimensionner",
+            "Nouvelle largeur:",
+            initialvalue=self.grid_width,
+            minvalue=5,
+            maxvalue=500,
+            parent=root,
+        )
+        if width is None:
+            return
+        height = simpledialog.askinteger(
+            "Redimensionner",
+            "Nouvelle hauteur:",
+            initialvalue=self.grid_height,
+            minvalue=5,
+            maxvalue=500,
+            parent=root,
+        )
+        if height is None:
+            return
+        new_grid = np.zeros((height, width), dtype=self.grid.dtype)
+        copy_height = min(self.grid_height, height)
+        copy_width = min(self.grid_width, width)
+        np.copyto(
+            new_grid[:copy_height, :copy_width], self.grid[:copy_height, :copy_width]
+        )
+        self.grid = new_grid
+        self.grid_width, self.grid_height = width, height
+        self.has_changes = True
+        self._invalidate_grid_caches()
+        self._update_stats()
+        self._fit_grid_to_view()
 
     def _confirm_action(self, message: str) -> bool:
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            return messagebox.askyesno("Confirmation", message)
-        finally:
-            root.destroy()
+        from tkinter import messagebox
+
+        root = self._get_tk_root()
+        return messagebox.askyesno("Confirmation", message, parent=root)
 
     # ------------------------- Mode activation helpers -------------------------
     def _activate_coordinate_mode(self):
@@ -509,10 +645,13 @@ class GridEditor:
         self._reset_pathfinding()
 
     def _activate_pathfinding_mode(self):
-        if not PATHFINDING_AVAILABLE:
+        from tkinter import messagebox
+
+        if not _ensure_pathfinding():
             messagebox.showerror(
                 "Pathfinding indisponible",
                 "Le module pathfinding n'est pas disponible.",
+                parent=self._get_tk_root(),
             )
             return
         self.pathfinding_mode = True
@@ -529,18 +668,23 @@ class GridEditor:
         self.computed_path = None
         self.path_stats = None
         self.pathfinding_step = 0
+        self._path_version += 1
 
     def _compute_pathfinding(self):
         if not self.path_start or not self.path_goal:
             return
         try:
             poi_coords = np.array([self.path_start, self.path_goal])
+            if self._walkable is None:
+                # Same walkability rule as the solver: free cells and POIs
+                self._walkable = (self.grid == 0) | (self.grid == 1)
             solver = PathfindingSolverFactory.create_solver(
                 grid_with_poi=self.grid,
                 distance_threshold_grid=1000000.0,
                 poi_coords=poi_coords,
                 algorithm=self.pathfinding_algorithm,
                 diagonal_movement=True,
+                walkable_matrix=self._walkable,
             )
 
             # Indicate calculation is starting
@@ -553,17 +697,16 @@ class GridEditor:
             computation_time = time.time() - start_time
 
             print(f"⏱️ Calcul terminé en {computation_time*1000:.2f} ms")
-            euclidean_dist = np.sqrt(
-                (self.path_goal[0] - self.path_start[0]) ** 2
-                + (self.path_goal[1] - self.path_start[1]) ** 2
+            euclidean_dist = float(
+                np.hypot(
+                    self.path_goal[0] - self.path_start[0],
+                    self.path_goal[1] - self.path_start[1],
+                )
             )
             if path:
-                path_distance = 0.0
-                for i in range(len(path) - 1):
-                    p1, p2 = path[i], path[i + 1]
-                    path_distance += np.sqrt(
-                        (p2[0] - p1[0]) ** 2 + (p2[1] - p1[1]) ** 2
-                    )
+                # Sum of segment lengths in a single vectorized pass
+                steps = np.diff(np.asarray(path, dtype=np.float64), axis=0)
+                path_distance = float(np.hypot(steps[:, 0], steps[:, 1]).sum())
                 self.path_stats = {
                     "success": True,
                     "algorithm": self.pathfinding_algorithm.upper(),
@@ -584,6 +727,7 @@ class GridEditor:
                     "error": "No path found",
                 }
             self.computed_path = path
+            self._path_version += 1
             self.pathfinding_step = 2
         except Exception as e:
             self.path_stats = {
@@ -594,6 +738,72 @@ class GridEditor:
             print(f"❌ Pathfinding error: {e}")
 
     # ------------------------- UI drawing -------------------------
+    def _layout_metrics(self) -> dict:
+        """Return the cached UI rectangles, recomputing them if the geometry changed."""
+        key = (
+            self.screen_width,
+            self.screen_height,
+            int(self.offset_x),
+            int(self.offset_y),
+            self.cell_size,
+            self.grid_width,
+            self.grid_height,
+            self.open_dropdown,
+        )
+        if key != self._layout_key:
+            self._on_layout_changed()
+            self._layout_key = key
+        return self._layout
+
+    def _on_layout_changed(self):
+        """Recompute palette, info panel and mode area rectangles."""
+        grid_w = self.grid_width * self.cell_size
+        grid_h = self.grid_height * self.cell_size
+
+        # Palette: default top is below the menu
+        palette_x = 10
+        palette_y = self.top_menu_height + 8
+        item_size = 32
+        gap = 10
+        # If a dropdown menu is open, push the palette below the dropdown area
+        if self.open_dropdown:
+            items = self.dropdowns.get(self.open_dropdown, [])
+            item_h = 22
+            dropdown_height = item_h * max(1, len(items))
+            palette_y = self.top_menu_height + dropdown_height + 12
+        # Also ensure palette doesn't overlap the top of the info panel area
+        _, info_top_y, _, _ = self._get_available_grid_area()
+        palette_y = max(palette_y, self.top_menu_height + 8, info_top_y)
+        palette_rects = [
+            pygame.Rect(
+                palette_x, palette_y + i * (item_size + gap), item_size, item_size
+            )
+            for i in range(len(self.palette))
+        ]
+
+        # Place the Info panel to the right of the grid, but ensure its top is below the menu bar
+        info_x = self.offset_x + grid_w + 20
+        info_y = self.top_menu_height + 8
+        info_width = self.ui_panel_width
+        # Height limited by available vertical space under the menu
+        info_height = min(self.screen_height - info_y - 40, 800)
+        # If info panel would go off screen on the right, clamp to screen right
+        if info_x + info_width + 8 > self.screen_width:
+            info_x = self.screen_width - info_width - 8
+            info_x = max(info_x, 8)
+
+        # Mode-specific area under the main grid
+        area_x = max(8, self.offset_x)
+        area_y = self.offset_y + grid_h + 10
+        area_w = min(grid_w, self.screen_width - self.offset_x - 40)
+        area_h = self.mode_info_height - 20
+
+        self._layout = {
+            "palette_rects": palette_rects,
+            "info_rect": pygame.Rect(info_x, info_y, info_width, info_height),
+            "mode_area_rect": pygame.Rect(area_x, area_y, area_w, area_h),
+        }
+
     def _draw_menu_bar(self):
         # Draw top menu bar
         menu_rect = pygame.Rect(0, 0, self.screen_width, self.top_menu_height)
@@ -635,78 +845,78 @@ class GridEditor:
 
     def _draw_palette(self):
         # Vertical palette on left side (positioned below the top menu to avoid overlay)
-        palette_x = 10
-        # Default palette top is below the menu
-        palette_y = self.top_menu_height + 8
-        item_size = 32
-        gap = 10
-
-        # If a dropdown menu is open, push the palette below the dropdown area
-        if self.open_dropdown:
-            items = self.dropdowns.get(self.open_dropdown, [])
-            item_h = 22
-            dropdown_height = item_h * max(1, len(items))
-            palette_y = self.top_menu_height + dropdown_height + 12
-
-        # Also ensure palette doesn't overlap the top of the info panel area
-        _, info_top_y, _, _ = self._get_available_grid_area()
-        palette_y = max(palette_y, self.top_menu_height + 8, info_top_y)
-
-        for i, (label, color, val) in enumerate(self.palette):
-            rect = pygame.Rect(
-                palette_x, palette_y + i * (item_size + gap), item_size, item_size
-            )
+        for rect, (label, color, val) in zip(
+            self._layout_metrics()["palette_rects"], self.palette
+        ):
             pygame.draw.rect(self.screen, color, rect)
             pygame.draw.rect(self.screen, COLORS["grid_line"], rect, 2)
             # Draw border for selected
             if self.side_selected_tool == val:
                 pygame.draw.rect(self.screen, (0, 120, 215), rect, 3)
-            # clickable area store
-            setattr(self, f"palette_area_{i}", rect)
             # small label
             label_surf = self.tiny_font.render(label, True, COLORS["text"])
             self.screen.blit(label_surf, (rect.right + 8, rect.y + 6))
 
     def _draw_grid(self):
-        # Grid background (only in the available area)
-        grid_w = self.grid_width * self.cell_size
-        grid_h = self.grid_height * self.cell_size
-        grid_rect = pygame.Rect(self.offset_x, self.offset_y, grid_w, grid_h)
-        pygame.draw.rect(self.screen, COLORS["background"], grid_rect)
-
-        # Draw cells
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                cell_rect = pygame.Rect(
-                    self.offset_x + x * self.cell_size,
-                    self.offset_y + y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
-                # Only draw if visible (optimization)
-                if (
-                    cell_rect.right < 0
-                    or cell_rect.left > self.screen_width
-                    or cell_rect.bottom < 0
-                    or cell_rect.top > self.screen_height
-                ):
-                    continue
-                cell_value = self.grid[y, x]
-                if cell_value == 0:
-                    color = COLORS["navigable"]
-                elif cell_value == 1:
-                    color = COLORS["poi"]
-                elif cell_value == 2:
-                    color = COLORS["shelf"]
-                else:
-                    color = COLORS["obstacle"]
-                pygame.draw.rect(self.screen, color, cell_rect)
-                pygame.draw.rect(self.screen, COLORS["grid_line"], cell_rect, 1)
+        cell_size = self.cell_size
+        grid_rect = pygame.Rect(
+            self.offset_x,
+            self.offset_y,
+            self.grid_width * cell_size,
+            self.grid_height * cell_size,
+        )
+        view_rect = grid_rect.clip(self.screen.get_rect())
+        if view_rect.width and view_rect.height:
+            # Cells are drawn in the surface's coordinates
+            origin = (grid_rect.x - view_rect.x, grid_rect.y - view_rect.y)
+            key = (tuple(view_rect), origin, cell_size)
+            if self._grid_surface_key != key:
+                self._render_grid_surface(view_rect.size, origin)
+                self._grid_surface_key = key
+            elif self._dirty_cells:
+                for row, col in self._dirty_cells:
+                    self._draw_cell(self._grid_surface, origin, row, col)
+            self._dirty_cells.clear()
+            self.screen.blit(self._grid_surface, view_rect.topleft)
         # Zones and pathfinding
         self._draw_zones()
         if self.pathfinding_mode:
             self._draw_pathfinding_elements()
 
+    def _render_grid_surface(self, size: Tuple[int, int], origin: Tuple[int, int]):
+        """Redraw every visible cell onto the offscreen grid surface."""
+        if self._grid_surface is None or self._grid_surface.get_size() != size:
+            self._grid_surface = pygame.Surface(size).convert()
+        self._grid_surface.fill(COLORS["background"])
+        cell_size = self.cell_size
+        # Only the cells intersecting the surface
+        col_start = max(0, -origin[0] // cell_size)
+        row_start = max(0, -origin[1] // cell_size)
+        col_end = min(self.grid_width, -(-(size[0] - origin[0]) // cell_size))
+        row_end = min(self.grid_height, -(-(size[1] - origin[1]) // cell_size))
+        for row in range(row_start, row_end):
+            for col in range(col_start, col_end):
+                self._draw_cell(self._grid_surface, origin, row, col)
+
+    def _draw_cell(
+        self,
+        surface: pygame.Surface,
+        origin: Tuple[int, int],
+        row: int,
+        col: int,
+    ):
+        cell_rect = pygame.Rect(
+            origin[0] + col * self.cell_size,
+            origin[1] + row * self.cell_size,
+            self.cell_size,
+            self.cell_size,
+        )
+        value = self.grid[row, col]
+        # Unexpected values are drawn as obstacles, as the if/elif chain did
+        color = CELL_COLOR[value + 1] if -1 <= value <= 2 else COLORS["obstacle"]
+        pygame.draw.rect(surface, color, cell_rect)
+        pygame.draw.rect(surface, COLORS["grid_line"], cell_rect, 1)
+
     def _draw_zones(self):
         if not self.zones:
             return
@@ -733,38 +943,77 @@ class GridEditor:
         self.screen.blit(zone_surface, (0, 0))
 
     def _draw_pathfinding_elements(self):
+        # Only the visible part of the grid gets an overlay (a fully zoomed-in
+        # 500x500 grid would not fit in a single surface)
+        grid_rect = pygame.Rect(
+            self.offset_x,
+            self.offset_y,
+            self.grid_width * self.cell_size,
+            self.grid_height * self.cell_size,
+        )
+        overlay_rect = grid_rect.clip(self.screen.get_rect())
+        if overlay_rect.width == 0 or overlay_rect.height == 0:
+            return
+        key = (
+            tuple(overlay_rect),
+            grid_rect.topleft,
+            self.cell_size,
+            self.path_start,
+            self.path_goal,
+            self._path_version,
+        )
+        if self._path_overlay is None or self._path_overlay_key != key:
+            self._render_path_overlay(grid_rect, overlay_rect)
+            self._path_overlay_key = key
+        self.screen.blit(self._path_overlay, overlay_rect.topleft)
+
+    def _render_path_overlay(self, grid_rect: pygame.Rect, overlay_rect: pygame.Rect):
+        """Redraw path, start and goal onto the transparent path overlay."""
+        if (
+            self._path_overlay is None
+            or self._path_overlay.get_size() != overlay_rect.size
+        ):
+            # convert_alpha() matches the display pixel format once (the display
+            # exists since __init__), so per-frame blits avoid a format conversion
+            self._path_overlay = pygame.Surface(
+                overlay_rect.size, pygame.SRCALPHA
+            ).convert_alpha()
+        overlay = self._path_overlay
+        overlay.fill((0, 0, 0, 0))
+        # Overlay-local origin of the grid's top-left cell
+        origin_x = grid_rect.x - overlay_rect.x
+        origin_y = grid_rect.y - overlay_rect.y
+        cell_size = self.cell_size
+        half_cell = cell_size // 2
         if self.computed_path and len(self.computed_path) > 1:
-            path_points = []
-            for px, py in self.computed_path:
-                screen_x = self.offset_x + py * self.cell_size + self.cell_size // 2
-                screen_y = self.offset_y + px * self.cell_size + self.cell_size // 2
-                path_points.append((screen_x, screen_y))
-            if len(path_points) > 1:
-                # Draw path with thicker red line for better visibility
-                pygame.draw.lines(
-                    self.screen, COLORS["path_line"], False, path_points, 5
+            path_points = [
+                (
+                    origin_x + py * cell_size + half_cell,
+                    origin_y + px * cell_size + half_cell,
                 )
-            # Draw path points as larger red circles
-            for point in path_points[1:-1]:
-                pygame.draw.circle(self.screen, COLORS["path_line"], point, 3)
+                for px, py in self.computed_path
+            ]
+            # Draw path with thicker red line for better visibility
+            # (the 5px stroke already covers interior points, no per-point circles)
+            pygame.draw.lines(overlay, COLORS["path_line"], False, path_points, 5)
         if self.path_start:
             sx, sy = self.path_start
             start_rect = pygame.Rect(
-                self.offset_x + sy * self.cell_size + 2,
-                self.offset_y + sx * self.cell_size + 2,
-                self.cell_size - 4,
-                self.cell_size - 4,
+                origin_x + sy * cell_size + 2,
+                origin_y + sx * cell_size + 2,
+                cell_size - 4,
+                cell_size - 4,
             )
-            pygame.draw.rect(self.screen, COLORS["path_start"], start_rect)
+            pygame.draw.rect(overlay, COLORS["path_start"], start_rect)
         if self.path_goal:
             gx, gy = self.path_goal
             goal_rect = pygame.Rect(
-                self.offset_x + gy * self.cell_size + 2,
-                self.offset_y + gx * self.cell_size + 2,
-                self.cell_size - 4,
-                self.cell_size - 4,
+                origin_x + gy * cell_size + 2,
+                origin_y + gx * cell_size + 2,
+                cell_size - 4,
+                cell_size - 4,
             )
-            pygame.draw.rect(self.screen, COLORS["path_goal"], goal_rect)
+            pygame.draw.rect(overlay, COLORS["path_goal"], goal_rect)
 
     def _draw_info_panel(self):
         """
@@ -773,18 +1022,7 @@ class GridEditor:
         """
         if not self.infos_visible:
             return
-        # Place the Info panel to the right of the grid, but ensure its top is below the menu bar
-        info_x = self.offset_x + self.grid_width * self.cell_size + 20
-        # Ensure info panel is within screen and not overlapping menu
-        info_y = self.top_menu_height + 8
-        info_width = self.ui_panel_width
-        # Height limited by available vertical space under the menu
-        info_height = min(self.screen_height - info_y - 40, 800)
-        # If info panel would go off screen on the right, clamp to screen right
-        if info_x + info_width + 8 > self.screen_width:
-            info_x = self.screen_width - info_width - 8
-            info_x = max(info_x, 8)
-        info_rect = pygame.Rect(info_x, info_y, info_width, info_height)
+        info_rect = self._layout_metrics()["info_rect"]
         pygame.draw.rect(self.screen, COLORS["ui_bg"], info_rect)
         pygame.draw.rect(self.screen, COLORS["grid_line"], info_rect, 1)
         # Title
@@ -831,13 +1069,7 @@ class GridEditor:
 
     def _draw_mode_info_area(self):
         # Dedicated area under main grid for active mode information
-        area_x = max(8, self.offset_x)
-        area_y = self.offset_y + self.grid_height * self.cell_size + 10
-        area_w = min(
-            self.grid_width * self.cell_size, self.screen_width - self.offset_x - 40
-        )
-        area_h = self.mode_info_height - 20
-        area_rect = pygame.Rect(area_x, area_y, area_w, area_h)
+        area_rect = self._layout_metrics()["mode_area_rect"]
         pygame.draw.rect(self.screen, COLORS["ui_bg"], area_rect)
         pygame.draw.rect(self.screen, COLORS["grid_line"], area_rect, 1)
         if self.coordinate_mode:
@@ -905,12 +1137,19 @@ class GridEditor:
 
     # ------------------------- Input handling -------------------------
     def _get_grid_pos(self, mouse_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-        mx, my = mouse_pos
-        col = (mx - self.offset_x) // self.cell_size
-        row = (my - self.offset_y) // self.cell_size
-        if 0 <= col < self.grid_width and 0 <= row < self.grid_height:
-            return int(row), int(col)
-        return None
+        # Called on every mouse motion: bounds-check in pixel space first so the
+        # floor division only ever sees non-negative ints.
+        cell_size = self.cell_size
+        px = mouse_pos[0] - self.offset_x
+        py = mouse_pos[1] - self.offset_y
+        if (
+            px < 0
+            or py < 0
+            or px >= self.grid_width * cell_size
+            or py >= self.grid_height * cell_size
+        ):
+            return None
+        return int(py) // cell_size, int(px) // cell_size
 
     def _handle_menu_click(self, pos: Tuple[int, int]):
         # Toggle dropdown open/close when clicking menu titles
@@ -940,8 +1179,7 @@ class GridEditor:
         return False
 
     def _handle_palette_click(self, pos: Tuple[int, int]) -> bool:
-        for i, _ in enumerate(self.palette):
-            rect = getattr(self, f"palette_area_{i}")
+        for i, rect in enumerate(self._layout_metrics()["palette_rects"]):
             if rect.collidepoint(pos):
                 _, _, val = self.palette[i]
                 self.side_selected_tool = val
@@ -1011,9 +1249,11 @@ class GridEditor:
                     self.drag_tool = new_value
                 else:
                     return
+                self._last_drag_cell = grid_pos
                 if self.grid[x, y] != new_value:
                     self.grid[x, y] = new_value
                     self.has_changes = True
+                    self._invalidate_grid_caches([grid_pos])
                     self._update_stats()
 
     def _handle_mouse_drag(self, pos: Tuple[int, int]):
@@ -1029,11 +1269,15 @@ class GridEditor:
         if self.drag_tool is None:
             return
         grid_pos = self._get_grid_pos(pos)
+        if grid_pos == self._last_drag_cell:
+            return
+        self._last_drag_cell = grid_pos
         if grid_pos:
             x, y = grid_pos
             if self.grid[x, y] != self.drag_tool:
                 self.grid[x, y] = self.drag_tool
                 self.has_changes = True
+                self._invalidate_grid_caches([grid_pos])
                 self._update_stats()
 
     def _handle_mouse_up(self):
@@ -1041,6 +1285,7 @@ class GridEditor:
         if self.panning:
             self.panning = False
         self.drag_tool = None
+        self._last_drag_cell = None
 
     def _handle_mouse_wheel(self, event):
         # pygame.MOUSEWHEEL: event.y (vertical wheel) positive = up
@@ -1110,26 +1355,24 @@ class GridEditor:
         self._fit_grid_to_view()
 
     def _show_about(self):
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            messagebox.showinfo(
-                "À propos",
-                "NaviStore Grid Editor — Refactorisé UI moderne intégrée (Pygame) Maintient la logique existante.",
-            )
-        finally:
-            root.destroy()
+        from tkinter import messagebox
+
+        root = self._get_tk_root()
+        messagebox.showinfo(
+            "À propos",
+            "NaviStore Grid Editor — Refactorisé UI moderne intégrée (Pygame) Maintient la logique existante.",
+            parent=root,
+        )
 
     def _show_help(self):
-        root = tk.Tk()
-        root.withdraw()
-        try:
-            messagebox.showinfo(
-                "Aide",
-                "Voir le menu Fichier -> Infos pour les raccourcis et la légende. F1 pour aide.",
-            )
-        finally:
-            root.destroy()
+        from tkinter import messagebox
+
+        root = self._get_tk_root()
+        messagebox.showinfo(
+            "Aide",
+            "Voir le menu Fichier -> Infos pour les raccourcis et la légende. F1 pour aide.",
+            parent=root,
+        )
 
     def _quit_editor(self):
         if self.has_changes:
@@ -1222,9 +1465,17 @@ class GridEditor:
 
     # ------------------------- Main loop -------------------------
     def run(self):
-        clock = pygame.time.Clock()
+        try:
+            self._main_loop()
+        finally:
+            # Tk root lives for the whole session; tear it down even on errors
+            self._destroy_tk_root()
+            pygame.quit()
+
+    def _main_loop(self):
         while self.running:
             for event in pygame.event.get():
+                self._last_input_ms = pygame.time.get_ticks()
                 if event.type == pygame.QUIT:
                     self._quit_editor()
                 elif event.type == pygame.MOUSEBUTTONDOWN:
@@ -1283,8 +1534,13 @@ class GridEditor:
             )
 
             pygame.display.flip()
-            clock.tick(60)
-        pygame.quit()
+            # Drop to a lower frame cap while idle (no events, no held keys, no pan)
+            idle = (
+                not self.keys_held
+                and not self.panning
+                and pygame.time.get_ticks() - self._last_input_ms > IDLE_DELAY_MS
+            )
+            self._clock.tick(IDLE_FPS if idle else ACTIVE_FPS)
 
     @classmethod
     def with_path(cls, grid=None, edge_length=None, path=None):
@@ -1293,10 +1549,11 @@ class GridEditor:
         """
         instance = cls()
         if grid is not None:
-            instance.grid = grid.copy()
+            instance.grid = grid.astype(GRID_DTYPE)
             instance.grid_height, instance.grid_width = grid.shape
         if edge_length is not None:
             instance.edge_length = edge_length
+        instance._invalidate_grid_caches()
         if path:
             instance.show_path(path)
         return instance
@@ -1307,6 +1564,7 @@ class GridEditor:
         """
         self.show_path(None)
 
+
 def main():
     try:
         editor = GridEditor()
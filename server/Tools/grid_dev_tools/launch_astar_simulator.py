@@ -6,7 +6,6 @@ Script simple pour démarrer le simulateur avec différentes options.
 """
 
 import os
-import sys
 
 
 def main():
@@ -34,9 +33,17 @@ def main():
     print("   • ESC: Quitter")
     print("")
 
-    # Lancer le simulateur
+    # Lancer le simulateur dans ce processus (pas de nouvel interpréteur)
     try:
-        os.system(f'python "{simulator_path}"')
+        from astar_simulator import main as simulator_main
+    except ImportError as e:
+        print(f"❌ Erreur d'importation du simulateur: {e}")
+        print("Assurez-vous d'avoir installé les dépendances:")
+        print("  pip install pygame numpy h5py")
+        return
+
+    try:
+        simulator_main()
     except KeyboardInterrupt:
         print("\n🛑 Simulateur interrompu par l'utilisateur")
     except Exception as e:
@@ -4,14 +4,11 @@ Testeur d'optimisation de chemin avec interface visuelle.
 Charge une grille H5, génère des POIs aléatoires et teste l'API d'optimisation.
 """
 
+import logging
 import pygame
 import numpy as np
 import h5py
 import requests
-import numpy as np
-import random
-import tkinter as tk
-from tkinter import filedialog, messagebox
 import sys
 import os
 from typing import List, Tuple, Optional
@@ -23,6 +20,9 @@ sys.path.append(root_path)
 
 from api_navimall.path_optimization.utils import real_world_to_grid_coords
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
 # Configuration des couleurs
 COLORS = {
     "navigable": (255, 255, 255),  # Blanc - zone libre
@@ -41,6 +41,9 @@ COLORS = {
 DEFAULT_CELL_SIZE = VISUAL_CONFIG["cell_size"]
 API_BASE_URL = API_CONFIG["base_url"]
 API_KEY = API_CONFIG["api_key"]
+WAYPOINT_RADIUS = 3
+# Événements qui imposent de redessiner la scène (fenêtre découverte, etc.)
+REPAINT_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED)
 
 
 class PathOptimizationTester:
@@ -56,21 +59,40 @@ class PathOptimizationTester:
 
         # Variables de grille
         self.layout = None
+        self._free_flat = None  # Indices à plat des cellules libres (cache)
         self.edge_length = 100.0
         self.cell_size = DEFAULT_CELL_SIZE
         self.poi_coords_real = []
         self.poi_coords_grid = []
         self.optimal_path = []
+        self._path_px = np.empty((0, 2), dtype=np.int32)  # Centres pixel (x, y)
+        self._path_points = []  # Mêmes centres, en tuples pour pygame
+        self._waypoint_blits = []
         self.grid_height = 0
         self.grid_width = 0
         self.layout_name = layout_name
 
         # Interface
         self.screen = None
+        self._grid_surface = None  # Rendu de la grille, construit une fois
+        self._poi_blits = None  # (surface, position) des POIs et de leurs numéros
+        self._waypoint_stamp = None  # Construit après set_mode (convert_alpha)
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
         self.running = True
 
+        # Session HTTP réutilisée entre les appels (une seule connexion keep-alive)
+        self._session = requests.Session()
+        self._session.headers["X-API-Key"] = API_KEY
+        self._session.mount(
+            "http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+        )
+        self._session.mount(
+            "https://",
+            requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1),
+        )
+        self._dirty = True  # La scène doit être redessinée
+
         # Offset pour centrer la grille
         self.offset_x = 50
         self.offset_y = 50
@@ -114,6 +136,14 @@ class PathOptimizationTester:
 
     def choose_grid_file(self) -> Optional[str]:
         """Ouvre un navigateur de fichiers pour choisir une grille H5."""
+        # Tkinter n'est chargé que si aucun layout n'a été passé en argument
+        try:
+            import tkinter as tk
+            from tkinter import filedialog
+        except ImportError:
+            print("❌ Tkinter indisponible, passez le nom du layout en argument")
+            return None
+
         root = tk.Tk()
         root.withdraw()
 
@@ -133,10 +163,26 @@ class PathOptimizationTester:
         """Charge une grille depuis un fichier H5."""
         try:
             with h5py.File(file_path, "r") as f:
-                self.layout = np.array(f["layout"])
+                ds = f["layout"]
+                offset = ds.id.get_offset() if ds.chunks is None else None
+                if offset is not None:
+                    # Dataset contigu non compressé : projection mémoire sans copie
+                    self.layout = np.memmap(
+                        file_path,
+                        dtype=ds.dtype,
+                        mode="r",
+                        offset=offset,
+                        shape=ds.shape,
+                    )
+                else:
+                    # Lecture directe dans un tableau préalloué (np.array copie deux fois)
+                    self.layout = np.empty(ds.shape, dtype=ds.dtype)
+                    ds.read_direct(self.layout)
                 self.edge_length = float(f["edge_length"][()])
 
             self.grid_height, self.grid_width = self.layout.shape
+            self._grid_surface = None
+            self._free_flat = None
             print(
                 f"✅ Grille chargée: {self.grid_width}x{self.grid_height}, edge_length={self.edge_length}cm"
             )
@@ -146,40 +192,39 @@ class PathOptimizationTester:
             print(f"❌ Erreur lors du chargement: {e}")
             return False
 
+    def _ensure_free_cells(self) -> np.ndarray:
+        """Indices à plat de toutes les cellules libres (valeur 0), calculés une fois."""
+        if self._free_flat is None:
+            self._free_flat = np.flatnonzero(self.layout == 0)
+        return self._free_flat
+
     def generate_random_pois(self, count: int = None) -> List[Tuple[float, float]]:
         """Génère des POIs aléatoires dans les zones libres."""
         if count is None:
             count = VISUAL_CONFIG["poi_count"]
-        # Trouver toutes les cellules libres (valeur 0)
-        free_cells = np.where(self.layout == 0)
-        free_positions = list(
-            zip(free_cells[0], free_cells[1])
-        )  # (row, col) format = (x, y) format
+        free_cells = self._ensure_free_cells()
 
-        if len(free_positions) < count:
-            print(f"⚠️ Seulement {len(free_positions)} cellules libres disponibles")
-            count = len(free_positions)
+        if free_cells.size < count:
+            print(f"⚠️ Seulement {free_cells.size} cellules libres disponibles")
+            count = free_cells.size
 
         # Choisir aléatoirement des positions
-        selected_positions = random.sample(free_positions, count - 1)
-        if (29, 19) in free_positions:
-            selected_positions.append((29, 19))
-
-        # Convertir en coordonnées monde (centre des cellules)
-        poi_coords_real = []
-        poi_coords_grid = []
-
-        for x, y in selected_positions:  # x=row, y=col
-            # Coordonnées du centre de la cellule - x et y gardent leur signification
-            real_x = (x + 0.5) * self.edge_length  # x=row -> real_x
-            real_y = (y + 0.5) * self.edge_length  # y=col -> real_y
-            poi_coords_real.append((real_x, real_y))
-            poi_coords_grid.append(
-                (int(x), int(y))
-            )  # (row, col) - conversion en int natif
+        picks = np.random.default_rng().choice(
+            free_cells, size=max(count - 1, 0), replace=False
+        )
+        rows, cols = np.unravel_index(picks, self.layout.shape)
+        selected_positions = np.stack([rows, cols], axis=1)  # (row, col)
+        if 29 < self.grid_height and 19 < self.grid_width and self.layout[29, 19] == 0:
+            selected_positions = np.vstack([selected_positions, [(29, 19)]])
+
+        # Convertir en coordonnées monde (centre des cellules), x=row -> real_x
+        real = (selected_positions + 0.5) * self.edge_length
+        poi_coords_real = [tuple(p) for p in real.tolist()]
+        poi_coords_grid = [tuple(p) for p in selected_positions.tolist()]
 
         self.poi_coords_real = poi_coords_real
         self.poi_coords_grid = poi_coords_grid
+        self._poi_blits = None
 
         print("-" * 30)
 
@@ -196,13 +241,15 @@ class PathOptimizationTester:
         """Appelle l'API pour uploader la grille."""
         try:
             with open(file_path, "rb") as f:
-                files = {"layout_file": f}
-                headers = {"X-API-Key": API_KEY}
-
-                response = requests.post(
-                    f"{API_BASE_URL}/path_optimization/upload_layout",
-                    files=files,
-                    headers=headers,
+                files = {
+                    "layout_file": (
+                        os.path.basename(file_path),
+                        f,
+                        "application/octet-stream",
+                    )
+                }
+                response = self._session.post(
+                    f"{API_BASE_URL}/path_optimization/upload_layout", files=files
                 )
 
             if response.status_code == 200:
@@ -216,7 +263,7 @@ class PathOptimizationTester:
             print(f"❌ Erreur lors de l'upload: {e}")
             return False
 
-    def call_optimize_path_api(self) -> Optional[List[Tuple[int, int]]]:
+    def call_optimize_path_api(self) -> Optional[np.ndarray]:
         """Appelle l'API d'optimisation et retourne le chemin."""
         try:
             # Préparer la requête
@@ -229,13 +276,9 @@ class PathOptimizationTester:
                 ],
             }
 
-            headers = {"X-API-Key": API_KEY, "Content-Type": "application/json"}
-
             print("🔄 Optimisation en cours...")
-            response = requests.post(
-                f"{API_BASE_URL}/path_optimization/optimize_path",
-                json=request_data,
-                headers=headers,
+            response = self._session.post(
+                f"{API_BASE_URL}/path_optimization/optimize_path", json=request_data
             )
 
             if response.status_code == 200:
@@ -245,58 +288,36 @@ class PathOptimizationTester:
                 print(f"   Temps de calcul: {result['computation_time']:.2f}s")
                 print(f"   Ordre de visite: {result['visiting_order']}")
 
-                # Debug: afficher le format du chemin
-                complete_path = result.get("complete_path", [])
+                # Extraire le chemin complet
+                complete_path = result.get("complete_path") or []
                 if complete_path:
-                    print(
-                        f"🔍 Debug: Format du premier point du chemin: {complete_path[0]} (type: {type(complete_path[0])})"
+                    first = complete_path[0]
+                    logger.debug(
+                        "Chemin de %d points, format du premier point: %r",
+                        len(complete_path),
+                        first,
                     )
-                    if len(complete_path) > 1:
+                    # Convertir en coordonnées grille, en un seul passage vectorisé.
+                    # Le format est détecté sur le premier point : tuple/liste [x, y]
+                    # ou dict {"x": x, "y": y}.
+                    # Les coordonnées du chemin sont déjà des indices de grille (row, col)
+                    if isinstance(first, dict):
+                        path_grid = np.fromiter(
+                            (v for p in complete_path for v in (p["x"], p["y"])),
+                            dtype=np.int32,
+                            count=2 * len(complete_path),
+                        ).reshape(-1, 2)
+                    elif isinstance(first, (list, tuple)):
+                        path_grid = np.asarray(complete_path, dtype=np.int32)
+                        path_grid = path_grid.reshape(len(complete_path), -1)[:, :2]
+                    else:
                         print(
-                            f"🔍 Debug: Format du deuxième point: {complete_path[1]} (type: {type(complete_path[1])})"
+                            f"⚠️ Format de point inconnu: {first} (type: {type(first)})"
                         )
+                        return None
 
-                # Extraire le chemin complet
-                complete_path = result.get("complete_path", [])
-                if complete_path:
-                    print(
-                        f"🔍 Debug: Nombre de points dans le chemin: {len(complete_path)}"
-                    )
-                    # Convertir en coordonnées grille
-                    path_grid = []
-                    for i, point in enumerate(complete_path):
-                        # Le point peut être soit un tuple/liste [x, y] soit un dict {"x": x, "y": y}
-                        if isinstance(point, (list, tuple)):
-                            # Format: [x, y] ou (x, y)
-                            x, y = point[0], point[1]
-                        elif isinstance(point, dict):
-                            # Format: {"x": x, "y": y}
-                            x, y = point["x"], point["y"]
-                        else:
-                            print(
-                                f"⚠️ Format de point inconnu: {point} (type: {type(point)})"
-                            )
-                            continue
-
-                        # Les coordonnées du chemin sont déjà des indices de grille (row, col)
-                        # Pas besoin de division par edge_length
-                        grid_x = int(x)  # x = row
-                        grid_y = int(y)  # y = col
-
-                        # Debug pour les premiers points
-                        if i < 3:
-                            print(
-                                f"🔍 Point {i}: grille=({x}, {y}) -> utilisé=({grid_x}, {grid_y})"
-                            )
-
-                        path_grid.append((grid_x, grid_y))
-
-                    print(
-                        f"🔍 Debug: Chemin grille généré avec {len(path_grid)} points"
-                    )
-                    print(
-                        f"🔍 Debug: Premiers points du chemin grille: {path_grid[:5]}"
-                    )
+                    logger.debug("Chemin grille généré avec %d points", len(path_grid))
+                    logger.debug("Premiers points du chemin grille: %s", path_grid[:5])
                     return path_grid
 
             else:
@@ -317,6 +338,10 @@ class PathOptimizationTester:
 
         self.screen = pygame.display.set_mode((display_width, display_height))
         pygame.display.set_caption("Testeur d'Optimisation de Chemin - NaviStore")
+        # Les surfaces en cache sont construites au format de l'écran
+        self._build_grid_surface()
+        self._build_waypoint_stamp()
+        self._poi_blits = None
 
     def interpolate_path_points(
         self, waypoints: List[Tuple[int, int]]
@@ -358,95 +383,134 @@ class PathOptimizationTester:
 
         return complete_path
 
-    def draw_grid(self):
-        """Dessine la grille avec POIs et chemin."""
+    def _build_grid_surface(self):
+        """Dessine une seule fois les cellules de la grille sur une surface hors écran."""
         if self.layout is None:
+            self._grid_surface = None
             return
 
-        for y in range(self.grid_height):  # y=row
-            for x in range(self.grid_width):  # x=col
-                # Position pixel
-                pixel_x = self.offset_x + x * self.cell_size
-                pixel_y = self.offset_y + y * self.cell_size
-                cell_rect = pygame.Rect(
-                    pixel_x, pixel_y, self.cell_size, self.cell_size
-                )
-
-                # Couleur de base selon le type de cellule
-                if self.layout[y, x] == -1:  # matrix[row, col]
-                    color = COLORS["obstacle"]
-                elif self.layout[y, x] == 2:  # shelf
-                    color = COLORS["shelf"]
-                else:
-                    color = COLORS["navigable"]
+        # Couleur de chaque cellule via une table : navigable, obstacle, shelf
+        lut = np.array(
+            [COLORS["navigable"], COLORS["obstacle"], COLORS["shelf"]], dtype=np.uint8
+        )
+        codes = np.zeros(self.layout.shape, dtype=np.intp)
+        codes[self.layout == -1] = 1
+        codes[self.layout == 2] = 2
+
+        # Une cellule = un pixel (indexé [x, y] comme surfarray), puis agrandissement
+        # au plus proche voisin jusqu'à cell_size
+        cells = pygame.Surface((self.grid_width, self.grid_height))
+        pygame.surfarray.blit_array(cells, lut[codes.T])
+        width = self.grid_width * self.cell_size
+        height = self.grid_height * self.cell_size
+        surface = pygame.transform.scale(cells, (width, height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+
+        # Contour d'un pixel de chaque cellule : deux lignes par colonne et par rangée
+        last = self.cell_size - 1
+        for x in range(self.grid_width):
+            for px in (x * self.cell_size, x * self.cell_size + last):
+                surface.fill(COLORS["grid_line"], (px, 0, 1, height))
+        for y in range(self.grid_height):
+            for py in (y * self.cell_size, y * self.cell_size + last):
+                surface.fill(COLORS["grid_line"], (0, py, width, 1))
+
+        self._grid_surface = surface
 
-                # Dessiner la cellule de base
-                pygame.draw.rect(self.screen, color, cell_rect)
-                pygame.draw.rect(self.screen, COLORS["grid_line"], cell_rect, 1)
+    def draw_grid(self):
+        """Dessine la grille (obstacles, rayons, zones libres)."""
+        if self.layout is None:
+            return
 
-                # Note: Les POIs sont maintenant dessinés séparément via draw_pois()
-                # pour éviter d'être écrasés par les points du chemin
+        if self._grid_surface is None:
+            self._build_grid_surface()
+        self.screen.blit(self._grid_surface, (self.offset_x, self.offset_y))
+
+        # Note: Les POIs sont dessinés séparément via draw_pois()
+        # pour éviter d'être écrasés par les points du chemin
+
+    def _build_waypoint_stamp(self):
+        """Point vert plus petit avec contour noir, posé sur chaque waypoint."""
+        size = 2 * WAYPOINT_RADIUS + 1
+        stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (WAYPOINT_RADIUS, WAYPOINT_RADIUS)
+        pygame.draw.circle(stamp, COLORS["path"], center, WAYPOINT_RADIUS)
+        pygame.draw.circle(stamp, COLORS["text"], center, WAYPOINT_RADIUS, 1)
+        if pygame.display.get_surface() is not None:
+            stamp = stamp.convert_alpha()
+        self._waypoint_stamp = stamp
+
+    def _grid_to_px(self, cells: np.ndarray) -> np.ndarray:
+        """Convertit des cellules (N, 2) (row, col) en centres pixel (x, y) int32."""
+        offset = np.array([self.offset_x, self.offset_y], dtype=np.int32)
+        return cells[:, ::-1] * self.cell_size + self.cell_size // 2 + offset
+
+    def _set_optimal_path(self, path: List[Tuple[int, int]]):
+        """Enregistre le chemin et précalcule les centres pixel de ses points."""
+        self.optimal_path = path
+        cells = np.asarray(path, dtype=np.int32).reshape(-1, 2)
+        self._path_px = self._grid_to_px(cells)
+        self._path_points = [tuple(p) for p in self._path_px.tolist()]
+        if self._waypoint_stamp is None:
+            self._build_waypoint_stamp()
+        self._waypoint_blits = [
+            (self._waypoint_stamp, (x - WAYPOINT_RADIUS, y - WAYPOINT_RADIUS))
+            for x, y in self._path_points
+        ]
 
     def draw_path_lines(self):
         """Dessine les lignes du chemin et les waypoints."""
-        if len(self.optimal_path) < 2:
+        if len(self._path_points) < 2:
             return
 
-        # Dessiner les lignes entre les waypoints
-        for i in range(len(self.optimal_path) - 1):
-            start_row, start_col = self.optimal_path[i]
-            end_row, end_col = self.optimal_path[i + 1]
-
-            # Convertir en coordonnées pixel (centre des cellules)
-            start_x = self.offset_x + start_col * self.cell_size + self.cell_size // 2
-            start_y = self.offset_y + start_row * self.cell_size + self.cell_size // 2
-            end_x = self.offset_x + end_col * self.cell_size + self.cell_size // 2
-            end_y = self.offset_y + end_row * self.cell_size + self.cell_size // 2
+        # Ligne verte fine reliant tous les waypoints, en un seul appel
+        pygame.draw.lines(self.screen, COLORS["path"], False, self._path_points, 2)
+
+        # Points aux waypoints (plus petits pour ne pas écraser les POIs)
+        self.screen.blits(self._waypoint_blits, doreturn=False)
+
+    def _build_poi_blits(self):
+        """Prépare le tampon POI et les numéros pour un seul appel à blits()."""
+        radius = min(
+            self.cell_size // 3, 10
+        )  # Rayon légèrement plus grand pour le texte
+
+        # POI rouge avec contour noir plus épais pour meilleure visibilité
+        stamp = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(stamp, COLORS["poi"], (radius, radius), radius)
+        pygame.draw.circle(stamp, COLORS["text"], (radius, radius), radius, 2)
+        stamp = stamp.convert_alpha()
+
+        # Choisir la taille de police en fonction du rayon
+        number_font = pygame.font.Font(None, max(12, min(16, radius)))
+
+        # POIs dans la grille et centres pixel (x, y), calculés en une fois
+        poi_grid = np.asarray(self.poi_coords_grid, dtype=np.int32).reshape(-1, 2)
+        inside = (
+            (poi_grid >= 0).all(axis=1)
+            & (poi_grid[:, 0] < self.grid_height)
+            & (poi_grid[:, 1] < self.grid_width)
+        )
+        centers = self._grid_to_px(poi_grid[inside])
 
-            # Dessiner la ligne verte fine
-            pygame.draw.line(
-                self.screen, COLORS["path"], (start_x, start_y), (end_x, end_y), 2
-            )
+        blits = []
+        for i, center in zip(np.flatnonzero(inside).tolist(), centers.tolist()):
+            blits.append((stamp, (center[0] - radius, center[1] - radius)))
 
-        # Dessiner les points aux waypoints (plus petits pour ne pas écraser les POIs)
-        for row, col in self.optimal_path:
-            center_x = self.offset_x + col * self.cell_size + self.cell_size // 2
-            center_y = self.offset_y + row * self.cell_size + self.cell_size // 2
+            # Numéro du POI centré dans le cercle, blanc pour le contraste
+            text_surface = number_font.render(
+                str(i), True, COLORS["background"]
+            ).convert_alpha()
+            blits.append((text_surface, text_surface.get_rect(center=center)))
 
-            # Point vert plus petit avec contour noir
-            pygame.draw.circle(self.screen, COLORS["path"], (center_x, center_y), 3)
-            pygame.draw.circle(self.screen, COLORS["text"], (center_x, center_y), 3, 1)
+        self._poi_blits = blits
 
     def draw_pois(self):
         """Dessine les POIs par-dessus tout pour qu'ils restent visibles."""
-        for i, (row, col) in enumerate(self.poi_coords_grid):
-            if 0 <= row < self.grid_height and 0 <= col < self.grid_width:
-                center_x = self.offset_x + col * self.cell_size + self.cell_size // 2
-                center_y = self.offset_y + row * self.cell_size + self.cell_size // 2
-                radius = min(
-                    self.cell_size // 3, 10
-                )  # Rayon légèrement plus grand pour le texte
-
-                # POI rouge avec contour noir plus épais pour meilleure visibilité
-                pygame.draw.circle(
-                    self.screen, COLORS["poi"], (center_x, center_y), radius
-                )
-                pygame.draw.circle(
-                    self.screen, COLORS["text"], (center_x, center_y), radius, 2
-                )  # Contour noir
-
-                # Afficher le numéro du POI au centre
-                poi_number = str(i)
-                # Choisir la taille de police en fonction du rayon
-                font_size = max(12, min(16, radius))
-                number_font = pygame.font.Font(None, font_size)
-                text_surface = number_font.render(
-                    poi_number, True, COLORS["background"]
-                )  # Blanc pour contraste
-
-                # Centrer le texte dans le cercle
-                text_rect = text_surface.get_rect(center=(center_x, center_y))
-                self.screen.blit(text_surface, text_rect)
+        if self._poi_blits is None:
+            self._build_poi_blits()
+        self.screen.blits(self._poi_blits, doreturn=False)
 
     def draw_ui(self):
         """Dessine l'interface utilisateur."""
@@ -551,30 +615,37 @@ class PathOptimizationTester:
             # 6. Optimiser chemin
             optimal_path = self.call_optimize_path_api()
             optimal_path = (
-                np.array(optimal_path, dtype=np.int32)
+                np.asarray(optimal_path, dtype=np.int32)
                 if optimal_path is not None
                 else None
             )
             optimal_path = real_world_to_grid_coords(optimal_path, self.edge_length)
-            optimal_path = [tuple(map(int, pt)) for pt in optimal_path]
-            self.optimal_path = optimal_path
+            optimal_path = [tuple(pt) for pt in optimal_path.tolist()]
+            self._set_optimal_path(optimal_path)
             print(f"✅ Test terminé! Chemin optimal avec {len(optimal_path)} points")
-            print(f"🔍 Debug: POIs grille: {self.poi_coords_grid[:5]}")
-            print(f"🔍 Debug: Chemin grille: {optimal_path[:5]}")
+            logger.debug("POIs grille: %s", self.poi_coords_grid[:5])
+            logger.debug("Chemin grille: %s", optimal_path[:5])
             print("✅ Visualisation du résultat...")
         except Exception as e:
             print("⚠️ Pas de chemin optimal calculé, affichage des POIs seulement:", e)
 
-        # 7. Affichage
-        clock = pygame.time.Clock()
+        # 7. Affichage : la scène est statique, on ne redessine que si nécessaire
+        self._dirty = True
 
         while self.running:
-            for event in pygame.event.get():
+            # Bloque jusqu'au prochain événement au lieu de boucler à 60 FPS
+            events = [pygame.event.wait(100)] + pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
+                elif event.type in REPAINT_EVENTS:
+                    self._dirty = True
+
+            if not self._dirty:
+                continue
 
             # Rendu avec ordre spécifique pour visibilité
             self.screen.fill(COLORS["background"])
@@ -583,8 +654,9 @@ class PathOptimizationTester:
             self.draw_pois()  # 3. POIs par-dessus tout (points rouges)
             self.draw_ui()  # 4. Interface utilisateur
             pygame.display.flip()
-            clock.tick(60)
+            self._dirty = False
 
+        self._session.close()
         pygame.quit()
 
 
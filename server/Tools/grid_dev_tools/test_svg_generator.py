@@ -5,7 +5,6 @@ Test script for LayoutSVGGenerator - demonstrates SVG generation from .h5 layout
 
 import os
 import sys
-import glob
 
 # Add parent directories to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -21,18 +20,29 @@ def test_svg_generation():
 
     # Look for .h5 files in assets directory
     assets_dir = "../../"
-    h5_files = glob.glob(os.path.join(assets_dir, "*.h5"))
+    # scandir reads the directory once and DirEntry caches the stat results
+    try:
+        with os.scandir(assets_dir) as it:
+            h5_files = [
+                entry
+                for entry in it
+                if entry.name.endswith(".h5")
+                and not entry.name.startswith(".")
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        h5_files = []
 
     if not h5_files:
         print("❌ No .h5 files found in assets directory")
         return
 
     print(f"🔍 Found {len(h5_files)} .h5 files:")
-    for file in h5_files:
-        print(f"   - {os.path.basename(file)}")
+    for entry in h5_files:
+        print(f"   - {entry.name}")
 
     # Get the most recent .h5 file based on modification time
-    input_h5 = max(h5_files, key=os.path.getmtime)
+    input_h5 = max(h5_files, key=lambda entry: entry.stat().st_mtime).path
     print(f"\n🎨 Generating SVG from: {os.path.basename(input_h5)}")
 
     # Create output directory
@@ -1,6 +1,8 @@
 import json
 from collections import Counter
 
+import numpy as np
+
 
 class LeclercProductsAnalyser:
 
@@ -11,44 +13,35 @@ class LeclercProductsAnalyser:
             return
 
         total_products = len(products)
-        brands = set(p["brand"] for p in products if p["brand"])
 
-        # Averages calculated only on valid products
-        avg_first_price = (
-            sum(
-                p["first_product_price"]
-                for p in products
-                if p["first_product_price"] is not None
-            )
-            / total_products
-        )
-        avg_second_price = (
-            sum(
-                p["second_product_price"]
-                for p in products
-                if p["second_product_price"] is not None
-            )
-            / total_products
-        )
+        # One pass over the products collects everything the stats need
+        brands = set()
+        categories = []
+        first_prices, second_prices, unit_prices = [], [], []
+        for p in products:
+            if p["brand"]:
+                brands.add(p["brand"])
+            categories.append(p.get("category", "default"))
+            if p["first_product_price"] is not None:
+                first_prices.append(p["first_product_price"])
+            if p["second_product_price"] is not None:
+                second_prices.append(p["second_product_price"])
+            if p["price_per_measurement_unit"] is not None:
+                unit_prices.append(p["price_per_measurement_unit"])
 
-        min_first_price = min(
-            p["first_product_price"]
-            for p in products
-            if p["first_product_price"] is not None
-        )
-        max_first_price = max(
-            p["first_product_price"]
-            for p in products
-            if p["first_product_price"] is not None
-        )
-        avg_price_per_unit = (
-            sum(
-                p["price_per_measurement_unit"]
-                for p in products
-                if p["price_per_measurement_unit"] is not None
-            )
-            / total_products
-        )
+        first_prices = np.array(first_prices, dtype=np.float64)
+        second_prices = np.array(second_prices, dtype=np.float64)
+        unit_prices = np.array(unit_prices, dtype=np.float64)
+
+        # Stats calculated only on valid prices (nan when there are none)
+        def stat(values, reduce):
+            return reduce(values) if values.size else float("nan")
+
+        avg_first_price = stat(first_prices, np.mean)
+        avg_second_price = stat(second_prices, np.mean)
+        min_first_price = stat(first_prices, np.min)
+        max_first_price = stat(first_prices, np.max)
+        avg_price_per_unit = stat(unit_prices, np.mean)
 
         print("=== Product Stats ===")
         print(f"Total products: {total_products}")
@@ -60,8 +53,6 @@ class LeclercProductsAnalyser:
         print(f"Highest first product price: €{max_first_price:.2f}")
 
         if is_display_categories:
-
-            categories = [p.get("category", "default") for p in products]
             counter = Counter(categories)
 
             print("\n=== Category Stats ===")
@@ -1,10 +1,51 @@
-from bs4 import BeautifulSoup
+from collections import deque
+from lxml import etree
 import json
 import re
 import json
 from pathlib import Path
 
 
+def _has_class(name):
+    """XPath predicate matching one token of the class attribute."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled once; evaluated in C on the lxml tree
+_BRAND = etree.XPath(f"(.//h3[{_has_class('brand')}])[1]")
+_TITLE = etree.XPath(f"(.//h4[{_has_class('p-title')}])[1]")
+_IMAGE = etree.XPath("(.//img[@id='product_img'])[1]")
+_PACKAGING_TYPE = etree.XPath(f"(.//div[{_has_class('PackagingType')}])[1]")
+_FIRST_PRODUCT = etree.XPath("(.//div[@id='first-product'])[1]")
+_SECOND_PRODUCT = etree.XPath("(.//div[@id='second-product'])[1]")
+_PACKAGING_PRICE = etree.XPath("(.//div[@id='packaging-price'])[1]")
+_PRICE_DECI = etree.XPath(f"(.//p[{_has_class('price-deci')}])[1]")
+_PRICE_CENTS = etree.XPath(f"(.//p[{_has_class('price-cents')}])[1]")
+_CATEGORY_IMAGE = etree.XPath(f"(.//div[{_has_class('img_div')}])[1]//img[1]")
+
+_PRICE_RE = re.compile(r"(\d+[,.]\d{2})")
+_RAYON_RE = re.compile(r"^Rayon\s+")
+
+
+def _first(xpath, element):
+    """First element matched by a compiled XPath, or None."""
+    found = xpath(element)
+    return found[0] if found else None
+
+
+def _parse_price(label):
+    """First 'x,yy' / 'x.yy' price in an aria-label, as a float, or None."""
+    if not label:
+        return None
+    match = _PRICE_RE.search(label)
+    return float(match.group(1).replace(",", ".")) if match else None
+
+
+def _text(element):
+    """Stripped text of an element and its descendants, or None."""
+    return element.xpath("string()").strip() if element is not None else None
+
+
 class LeclercProductsFetcher:
     """
     1 - Copy Leclerc website catalogues's html using the inspector and the copy(document.documentElement.outerHTML) command from the console.
@@ -18,22 +59,19 @@ class LeclercProductsFetcher:
     @staticmethod
     def __extract_price(product_div):
         """Extracts the price from a product div, using aria-label or p tags."""
-        if not product_div:
+        if product_div is None:
             return None
 
         # Try to extract the price from the aria-label attribute
-        aria_label = product_div.get("aria-label", "")
-        match = re.search(r"(\d+[,\.]\d{2})", aria_label)
-        if match:
-            return float(match.group(1).replace(",", "."))
+        price = _parse_price(product_div.get("aria-label"))
+        if price is not None:
+            return price
 
         # Otherwise, try to get from p tags
-        deci_tag = product_div.find("p", class_="price-deci")
-        cents_tag = product_div.find("p", class_="price-cents")
-        if deci_tag and cents_tag:
-            price_str = (
-                deci_tag.text.strip() + "." + cents_tag.text.strip().replace(",", "")
-            )
+        deci_tag = _first(_PRICE_DECI, product_div)
+        cents_tag = _first(_PRICE_CENTS, product_div)
+        if deci_tag is not None and cents_tag is not None:
+            price_str = _text(deci_tag) + "." + _text(cents_tag).replace(",", "")
             try:
                 return float(price_str)
             except ValueError:
@@ -41,78 +79,125 @@ class LeclercProductsFetcher:
         return None
 
     @staticmethod
-    def __get_category(case):
-        """Gets the product category from its parent 'category_xxx'."""
-        category_div = case.find_parent("div", id=re.compile(r"^category_"))
-        if category_div:
-            # Look for category header image
-            img_div = category_div.find("div", class_="img_div")
-            if img_div:
-                img_tag = img_div.find("img")
-                if img_tag and img_tag.get("alt"):
-                    # Clean 'Rayon XXX' if present
-                    alt_text = img_tag["alt"].strip()
-                    return re.sub(r"^Rayon\s+", "", alt_text)
+    def __category_label(category_div):
+        """Gets the label of a 'category_xxx' div from its header image."""
+        # Look for category header image
+        img_tag = _first(_CATEGORY_IMAGE, category_div)
+        if img_tag is not None and img_tag.get("alt"):
+            # Clean 'Rayon XXX' if present
+            alt_text = img_tag.get("alt").strip()
+            return _RAYON_RE.sub("", alt_text)
         return "default"
 
     @staticmethod
-    def fetch_products(html_path):
-        with open(html_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f, "html.parser")
-
-        articles = []
-        product_cases = soup.find_all("div", id="product-case")
-        for case in product_cases:
-            product = {}
-
-            # Name and brand
-            brand_tag = case.find("h3", class_="brand")
-            product["brand"] = brand_tag.text.strip() if brand_tag else None
-
-            title_tag = case.find("h4", class_="p-title")
-            product["title"] = title_tag.text.strip() if title_tag else None
-            if not product["title"]:
-                continue
+    def __parse_product(case):
+        """Extracts a product from its 'product-case' div, or None if it has no title."""
+        product = {}
 
-            # Image
-            img_tag = case.find("img", id="product_img")
-            product["image_url"] = img_tag["src"] if img_tag else None
+        # Name and brand
+        product["brand"] = _text(_first(_BRAND, case))
 
-            # Packaging Type
-            packaging_type_div = case.find("div", class_="PackagingType")
-            product["packaging_type"] = (
-                packaging_type_div.text.strip() if packaging_type_div else None
-            )
-            if product["packaging_type"] == "Le 1er produit":
-                product["packaging_type"] = None
+        product["title"] = _text(_first(_TITLE, case))
+        if not product["title"]:
+            return None
 
-            # Price
-            first_product_div = case.find("div", id="first-product")
-            second_product_div = case.find("div", id="second-product")
+        # Image
+        img_tag = _first(_IMAGE, case)
+        product["image_url"] = img_tag.get("src") if img_tag is not None else None
+
+        # Packaging Type
+        product["packaging_type"] = _text(_first(_PACKAGING_TYPE, case))
+        if product["packaging_type"] == "Le 1er produit":
+            product["packaging_type"] = None
+
+        # Price
+        first_product_div = _first(_FIRST_PRODUCT, case)
+        second_product_div = _first(_SECOND_PRODUCT, case)
+
+        product["first_product_price"] = LeclercProductsFetcher.__extract_price(
+            first_product_div
+        )
+        product["second_product_price"] = LeclercProductsFetcher.__extract_price(
+            second_product_div
+        )
+
+        # Price per kilo
+        packaging_div = _first(_PACKAGING_PRICE, case)
+        product["price_per_measurement_unit"] = (
+            _parse_price(packaging_div.get("aria-label"))
+            if packaging_div is not None
+            else None
+        )
+        return product
 
-            product["first_product_price"] = LeclercProductsFetcher.__extract_price(
-                first_product_div
-            )
-            product["second_product_price"] = LeclercProductsFetcher.__extract_price(
-                second_product_div
+    @staticmethod
+    def fetch_products(html_path, *, include_category=True, verbose=True):
+        return list(
+            LeclercProductsFetcher.iter_products(
+                html_path, include_category=include_category, verbose=verbose
             )
+        )
 
-            # Price per kilo
-            packaging_div = case.find("div", id="packaging-price")
-            if packaging_div:
-                match = re.search(
-                    r"(\d+[,\.]\d{2})", packaging_div.get("aria-label", "")
-                )
-                product["price_per_measurement_unit"] = (
-                    float(match.group(1).replace(",", ".")) if match else None
+    @staticmethod
+    def iter_products(html_path, *, include_category=True, verbose=True):
+        """Yields the products of the catalogue one at a time, as they are parsed.
+
+        Args:
+            html_path: Catalogue HTML file
+            include_category: Add each product's category (skips indexing the
+                category divs when False)
+            verbose: Print a progress line for each fetched product
+        """
+        # Streamed: each product case is parsed as soon as it is closed, then
+        # cleared, so the whole catalogue tree is never held in memory
+        events = etree.iterparse(
+            str(html_path),
+            events=("start", "end"),
+            tag="div",
+            html=True,
+            encoding="utf-8",
+        )
+
+        count = 0
+        # Category divs currently open (innermost last), and labels of the
+        # closed ones: a label is only known once its div is fully parsed
+        open_categories = []
+        labels = {}
+        # Products waiting for their category label, in document order
+        pending = deque()
+        for event, div in events:
+            div_id = div.get("id", "")
+            if div_id.startswith("category_"):
+                if event == "start":
+                    open_categories.append(div)
+                    continue
+                open_categories.pop()
+                if include_category:
+                    labels[div] = LeclercProductsFetcher.__category_label(div)
+            elif div_id == "product-case" and event == "end":
+                product = LeclercProductsFetcher.__parse_product(div)
+                category_div = (
+                    open_categories[-1]
+                    if include_category and open_categories
+                    else None
                 )
+                div.clear()
+                if product is None:
+                    continue
+                pending.append((product, category_div))
             else:
-                product["price_per_measurement_unit"] = None
+                continue
 
-            # Category
-            product["category"] = LeclercProductsFetcher.__get_category(case)
+            while pending and (pending[0][1] is None or pending[0][1] in labels):
+                product, category_div = pending.popleft()
 
-            articles.append(product)
-            print(f"Fetched {len(articles)} products from {html_path}.")
+                # Category
+                if include_category:
+                    product["category"] = (
+                        labels[category_div] if category_div is not None else "default"
+                    )
 
-        return articles
+                count += 1
+                if verbose:
+                    print(f"Fetched {count} products from {html_path}.")
+                yield product
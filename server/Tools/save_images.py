@@ -1,24 +1,27 @@
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, parse_qs
 
 # Chemins
 JSON_FILE = "../api_navimall/assets/json/products.json"
 IMAGES_DIR = os.path.join("..", "assets", "products_images")
 
-os.makedirs(IMAGES_DIR, exist_ok=True)
-
-# Charge le JSON
-with open(JSON_FILE, "r", encoding="utf-8") as f:
-    products = json.load(f)
+# Téléchargements en parallèle (limités par le réseau, pas par le GIL)
+MAX_WORKERS = 32
+# Les images sont écrites par blocs, sans charger la réponse entière en mémoire
+CHUNK_SIZE = 64 * 1024
+# Revérifie les images déjà présentes auprès du serveur (requête conditionnelle
+# If-None-Match / If-Modified-Since) au lieu de les sauter directement
+REVALIDATE = False
 
-for product in products:
-    image_url = product.get("image_url")
-    if not image_url:
-        continue
 
-    # Extraire le nom du fichier après 'media/'
+def image_filename(image_url):
+    """Nom du fichier image, extrait après 'media/' dans l'URL."""
     parsed_url = urlparse(image_url)
     path_parts = parsed_url.path.split("/")
     if "media" in path_parts:
@@ -31,15 +34,84 @@ for product in products:
     # Ajouter l'extension si nécessaire
     if not os.path.splitext(filename)[1]:
         filename += ".jpg"
+    return filename
 
-    save_path = os.path.join(IMAGES_DIR, filename)
 
-    # Télécharger l'image
+def conditional_headers(meta_path):
+    """En-têtes de requête conditionnelle d'après le fichier .meta d'une image."""
     try:
-        response = requests.get(image_url, timeout=10)
-        response.raise_for_status()
-        with open(save_path, "wb") as img_file:
-            img_file.write(response.content)
-        print(f"✅ {filename} téléchargé.")
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def download_one(session, image_url, save_path):
+    """Télécharge une image et retourne le message à afficher."""
+    filename = os.path.basename(save_path)
+    # ETag / Last-Modified de la dernière version téléchargée
+    meta_path = save_path + ".meta"
+    headers = {}
+    # Déjà téléchargée lors d'un précédent lancement (un fichier vide est refait)
+    if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
+        if REVALIDATE:
+            headers = conditional_headers(meta_path)
+        if not headers:
+            return f"⏭️ {filename} déjà présent."
+    # Écrit dans un fichier temporaire : un téléchargement interrompu ne doit
+    # pas laisser une image tronquée que les lancements suivants sauteraient
+    part_path = save_path + ".part"
+    try:
+        with session.get(
+            image_url, headers=headers, timeout=10, stream=True
+        ) as response:
+            if response.status_code == 304:
+                return f"⏭️ {filename} inchangé."
+            response.raise_for_status()
+            with open(part_path, "wb") as img_file:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    img_file.write(chunk)
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+        os.replace(part_path, save_path)
+        if meta["etag"] or meta["last_modified"]:
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        return f"✅ {filename} téléchargé."
     except Exception as e:
-        print(f"❌ Erreur pour {filename}: {e}")
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        return f"❌ Erreur pour {filename}: {e}"
+
+
+os.makedirs(IMAGES_DIR, exist_ok=True)
+
+# Charge le JSON
+with open(JSON_FILE, "r", encoding="utf-8") as f:
+    products = json.load(f)
+
+# Un seul téléchargement par fichier de destination
+downloads = {
+    os.path.join(IMAGES_DIR, image_filename(product["image_url"])): product["image_url"]
+    for product in products
+    if product.get("image_url")
+}
+
+# Session partagée : connexions keep-alive réutilisées par tous les threads
+session = requests.Session()
+adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+session.mount("https://", adapter)
+session.mount("http://", adapter)
+
+with session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    fetch = partial(download_one, session)
+    for message in executor.map(fetch, downloads.values(), downloads.keys()):
+        print(message)
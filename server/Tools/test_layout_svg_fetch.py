@@ -5,6 +5,26 @@ import webbrowser
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+
+CHUNK_SIZE = 64 * 1024
+UTF8_BOM = b"\xef\xbb\xbf"
+REQUEST_TIMEOUT = 30
+
+# Shared session: repeated fetches reuse keep-alive connections
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+
+def strip_leading_bom(data: bytes) -> bytes:
+    """Strip leading UTF-8 BOMs and whitespace, without decoding the bytes."""
+    while True:
+        data = data.lstrip(b"\n\r\t ")
+        if not data.startswith(UTF8_BOM):
+            return data
+        data = data[len(UTF8_BOM) :]
 
 
 def fetch_layout_svg(base_url: str, api_key: str, out_file: Path) -> Path:
@@ -12,7 +32,7 @@ def fetch_layout_svg(base_url: str, api_key: str, out_file: Path) -> Path:
     headers = {"x-api-key": api_key}
 
     print(f"Fetching SVG from {url} ...")
-    resp = requests.get(url, headers=headers)
+    resp = _session.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
     if resp.status_code != 200:
         # Try to surface possible JSON error from FastAPI
         try:
@@ -27,36 +47,22 @@ def fetch_layout_svg(base_url: str, api_key: str, out_file: Path) -> Path:
     print("Content-Encoding:", resp.headers.get("content-encoding"))
     print("Content-Length:", resp.headers.get("content-length"))
 
-    content = resp.content
-
-    # Try decode to strip BOM if present
-    text: str
-    try:
-        text = content.decode("utf-8")
-    except UnicodeDecodeError:
-        # Try with utf-8-sig to strip BOM
-        try:
-            text = content.decode("utf-8-sig")
-        except Exception:
-            # Fallback to raw bytes write
-            text = ""
-
-    # If decoded to text, ensure it starts with '<' after trimming
-    to_write_bytes: bytes
-    if text:
-        trimmed = text.lstrip("\ufeff\n\r\t ")
-        if not trimmed.startswith("<"):
-            # Print first 120 chars for debug
-            print("First 120 chars of response (trimmed):")
-            print(trimmed[:120])
-        to_write_bytes = trimmed.encode("utf-8")
-    else:
-        # Could not decode; write raw but log first 32 bytes
-        print("First 32 bytes:", content[:32])
-        to_write_bytes = content
-
+    # Stream the body to disk chunk by chunk; only the start of the document
+    # is inspected, to drop a UTF-8 BOM and leading whitespace
     out_file.parent.mkdir(parents=True, exist_ok=True)
-    out_file.write_bytes(to_write_bytes)
+    with out_file.open("wb") as f:
+        leading = True
+        for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+            if leading:
+                chunk = strip_leading_bom(chunk)
+                if not chunk:
+                    continue
+                leading = False
+                if not chunk.startswith(b"<"):
+                    # Print first 120 bytes for debug
+                    print("First 120 bytes of response (trimmed):")
+                    print(chunk[:120])
+            f.write(chunk)
     size_kb = out_file.stat().st_size / 1024.0
     print(f"Saved SVG to {out_file} ({size_kb:.1f} KB)")
     return out_file
@@ -3,18 +3,32 @@ from api_navimall.config import API_KEYS
 
 
 from fastapi import Header, HTTPException
+from types import MappingProxyType
 from api_navimall.config import API_KEYS
 
+# API key -> user info, built once: a single dict lookup per request.
+# Read-only mappings, so the same object can be returned to every request.
+# setdefault keeps the first user listed if a key is shared
+_KEY_INDEX = {}
+for _user, _info in API_KEYS.items():
+    _KEY_INDEX.setdefault(
+        _info["key"], MappingProxyType({"user": _user, "role": _info["role"]})
+    )
+
 
 def verify_api_key(x_api_key: str = Header(...)):
     """
     Verifies the provided API key against the stored keys.
     Raises HTTPException if the key is invalid.
     """
-    for user, info in API_KEYS.items():
-        if info["key"] == x_api_key:
-            return {"user": user, "role": info["role"]}
-    raise HTTPException(status_code=401, detail="Invalid API Key")
+    # An empty key is rejected with its own "Missing API Key" error before the
+    # index lookup
+    if not x_api_key:
+        raise HTTPException(status_code=401, detail="Missing API Key")
+    user_info = _KEY_INDEX.get(x_api_key)
+    if user_info is None:
+        raise HTTPException(status_code=401, detail="Invalid API Key")
+    return user_info
 
 
 def verify_write_rights(user_info=Depends(verify_api_key)):
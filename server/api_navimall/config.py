@@ -7,6 +7,9 @@ load_dotenv()
 # Configuration Elasticsearch
 ES_HOST = os.getenv("ES_HOST", "http://es:9200")
 ES_INDEX = os.getenv("ES_INDEX", "products")
+# Reindex products.json at startup, opt-in (NAVIMALL_REINDEX_ON_BOOT=1): otherwise
+# every worker would rebuild the index on boot. A missing index is still created
+REINDEX_ON_BOOT = os.getenv("NAVIMALL_REINDEX_ON_BOOT") == "1"
 
 api_keys_raw = os.getenv("API_KEYS")
 
@@ -1,6 +1,7 @@
 # crud stands for Create, Read, Update, Delete
 
-import json
+import orjson
+import os
 import time
 import logging
 from typing import Optional
@@ -25,6 +26,28 @@ logger = logging.getLogger(__name__)
 
 es: Optional[Elasticsearch] = None
 
+PRODUCTS_JSON_PATH = "api_navimall/assets/json/products.json"
+DATA_STORE_JSON_PATH = "api_navimall/assets/json/data_store.json"
+ES_MAPPING_JSON_PATH = "api_navimall/assets/json/es_mapping.json"
+
+# Parsed JSON assets by path, as (mtime_ns, data): reloaded only when the file
+# changes on disk (e.g. after ProductsManager updates it)
+_json_cache = {}
+
+
+def _load_json_cached(path: str):
+    """Load a JSON asset, reusing the parsed content while the file is unchanged.
+
+    The returned object is shared between calls and must not be modified.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        with open(path, "rb") as f:
+            cached = (mtime, orjson.loads(f.read()))
+        _json_cache[path] = cached
+    return cached[1]
+
 
 def wait_for_elasticsearch(
     host: str = ES_HOST,
@@ -49,19 +72,22 @@ def wait_for_elasticsearch(
     Raises:
         ConnectionError: Si Elasticsearch n'est pas disponible après max_wait_time
     """
-    start_time = time.time()
+    # Horloge monotone : insensible aux ajustements de l'heure système
+    start_time = time.monotonic()
+    elapsed = 0.0
     wait_interval = initial_wait
     attempt = 1
 
     logger.info(f"🔍 Attente d'Elasticsearch sur {host}...")
 
-    while time.time() - start_time < max_wait_time:
-        try:
-            # Create Elasticsearch client with proper configuration
-            es = Elasticsearch(
-                hosts=[host], request_timeout=5, max_retries=1, retry_on_timeout=True
-            )
+    # Create Elasticsearch client with proper configuration, once: every
+    # attempt reuses its connection pool (keep-alive connections)
+    es = Elasticsearch(
+        hosts=[host], request_timeout=5, max_retries=1, retry_on_timeout=True
+    )
 
+    while elapsed < max_wait_time:
+        try:
             # simple ping test
             if es.ping():
                 logger.info(f"🏥 Ping OK - Vérification de la santé du cluster...")
@@ -72,7 +98,7 @@ def wait_for_elasticsearch(
                     status = health.get("status", "unknown")
 
                     if status in ["green", "yellow"]:
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         logger.info(
                             f"✅ Elasticsearch prêt ! (statut: {status}, "
                             f"temps d'attente: {elapsed:.1f}s, tentatives: {attempt})"
@@ -94,8 +120,8 @@ def wait_for_elasticsearch(
         except Exception as e:
             logger.warning(f"⚠️ Erreur inattendue (tentative {attempt}): {e}")
 
-        # wait before next attempt
-        elapsed = time.time() - start_time
+        # wait before next attempt (elapsed measured once per attempt)
+        elapsed = time.monotonic() - start_time
         remaining = max_wait_time - elapsed
 
         if remaining <= wait_interval:
@@ -112,6 +138,7 @@ def wait_for_elasticsearch(
         )
 
         time.sleep(wait_interval)
+        elapsed += wait_interval
 
         # Increase interval with exponential backoff
         wait_interval = min(wait_interval * backoff_factor, max_interval)
@@ -161,6 +188,11 @@ def get_elasticsearch_health() -> dict:
         return {"status": "error", "error": str(e)}
 
 
+# Durée pendant laquelle un ping réussi est considéré comme valable
+PING_CACHE_SECONDS = 2.0
+_last_ping_ok = float("-inf")
+
+
 def ensure_elasticsearch_connection() -> bool:
     """
     S'assure que la connexion Elasticsearch est active.
@@ -169,16 +201,23 @@ def ensure_elasticsearch_connection() -> bool:
     Returns:
         True si la connexion est active, False sinon
     """
-    global es
+    global es, _last_ping_ok
+
+    # Connexion vérifiée il y a moins de PING_CACHE_SECONDS : pas de ping
+    now = time.monotonic()
+    if now - _last_ping_ok < PING_CACHE_SECONDS:
+        return True
 
     try:
         if es.ping():
+            _last_ping_ok = now
             return True
 
         logger.warning("🔄 Connexion Elasticsearch perdue, tentative de reconnexion...")
         es = wait_for_elasticsearch(
             max_wait_time=60
         )  # Attente réduite pour reconnexion
+        _last_ping_ok = time.monotonic()
         return True
 
     except Exception as e:
@@ -186,36 +225,96 @@ def ensure_elasticsearch_connection() -> bool:
         return False
 
 
-def reindex_products():
-    """Delete existing docs and load products from products.json into Elasticsearch."""
-    try:
-        with open("api_navimall/assets/json/products.json", "r") as f:
-            products = json.load(f)
+def _create_index(index: str):
+    """Create a products index with its mapping."""
+    mapping = _load_json_cached(ES_MAPPING_JSON_PATH)
+    es.indices.create(index=index, body=mapping)
+
 
-        # Delete all existing docs in the index
-        es.delete_by_query(index=ES_INDEX, body={"query": {"match_all": {}}})
+def _current_indices() -> list:
+    """Indices currently served under ES_INDEX (alias targets, or the legacy index)."""
+    if es.indices.exists_alias(name=ES_INDEX).body:
+        return list(es.indices.get_alias(name=ES_INDEX).body)
+    if es.indices.exists(index=ES_INDEX).body:
+        # Index created under the ES_INDEX name itself, before the alias was used
+        return [ES_INDEX]
+    return []
 
-        actions = [
-            {"_index": ES_INDEX, "_id": product["id"], "_source": product}
+
+def reindex_products():
+    """Load products from products.json into a new index and swap the ES_INDEX alias to it."""
+    try:
+        products = _load_json_cached(PRODUCTS_JSON_PATH)
+    except FileNotFoundError:
+        logger.warning("⚠️ products.json file not found, no products indexed")
+        if _current_indices():
+            return
+        products = []
+
+    # ES_INDEX is an alias: products are loaded into a fresh index, then the
+    # alias is moved in one atomic call, so searches never hit a missing index
+    new_index = f"{ES_INDEX}_{time.time_ns()}"
+    _create_index(new_index)
+    try:
+        # Generator: helpers.bulk sends the actions chunk by chunk, the full
+        # list of actions is never built
+        actions = (
+            {"_index": new_index, "_id": product["id"], "_source": product}
             for product in products
-        ]
+        )
         helpers.bulk(es, actions)
+        es.indices.refresh(index=new_index)
 
-        print(f"✅ {len(products)} products reindexed into '{ES_INDEX}'")
-    except FileNotFoundError:
-        print("⚠️ products.json file not found, no products indexed")
+        # remove_index drops the previous indices in the same atomic call
+        alias_actions = [{"add": {"index": new_index, "alias": ES_INDEX}}]
+        alias_actions += [
+            {"remove_index": {"index": index}} for index in _current_indices()
+        ]
+        es.indices.update_aliases(actions=alias_actions)
+    except Exception:
+        es.indices.delete(index=new_index, ignore_unavailable=True)
+        raise
+
+    logger.info(
+        "✅ %d products reindexed into '%s' (alias '%s')",
+        len(products),
+        new_index,
+        ES_INDEX,
+    )
 
 
 def create_index_if_missing():
-    """Create the index with mapping if it doesn't exist."""
+    """Create the index with mapping and load the products if it doesn't exist."""
     if not es.indices.exists(index=ES_INDEX).body:
-        with open("api_navimall/assets/json/es_mapping.json", "r") as f:
-            mapping = json.load(f)
-        es.indices.create(index=ES_INDEX, body=mapping)
-        print(f"✅ Index '{ES_INDEX}' created with mapping.")
         reindex_products()
+        logger.info("✅ Index '%s' created with mapping.", ES_INDEX)
     else:
-        print(f"ℹ️ Index '{ES_INDEX}' already exists, skipping creation.")
+        logger.info("ℹ️ Index '%s' already exists, skipping creation.", ES_INDEX)
+
+
+def _build_products_query(title: str = None, brand: str = None, category: str = None):
+    """
+    Build the Elasticsearch query body for __get_products, in a single pass
+    """
+    # Filtres exacts (brand est keyword, donc pas de .keyword)
+    filters = []
+    if brand:
+        filters.append({"term": {"brand": brand}})
+    if category:
+        filters.append({"term": {"category": category}})
+
+    # Cas 1: Recherche par title avec filtres optionnels
+    if title:
+        bool_query = {
+            "must": [{"match": {"title": {"query": title, "analyzer": "french"}}}]
+        }
+        if filters:
+            bool_query["filter"] = filters
+    # Cas 2: Pas de title, filtrer uniquement par brand et/ou category
+    else:
+        bool_query = {"filter": filters, "must": [{"match_all": {}}]}
+
+    return {"query": {"bool": bool_query}}
 
 
 def __get_products(
@@ -232,49 +331,19 @@ def __get_products(
         )
 
     # Construction de la requête
-    query_body = {"query": {"bool": {}}}
+    query_body = _build_products_query(title, brand, category)
 
-    # Cas 1: Recherche par title avec filtres optionnels
-    if title:
-        query_body["query"]["bool"]["must"] = [
-            {"match": {"title": {"query": title, "analyzer": "french"}}}
-        ]
-
-        # Ajout des filtres exacts si spécifiés
-        filters = []
-        if brand:
-            filters.append({"term": {"brand": brand}})
-        if category:
-            filters.append({"term": {"category": category}})
-
-        if filters:
-            query_body["query"]["bool"]["filter"] = filters
-
-    # Cas 2: Pas de title, filtrer uniquement par brand et/ou category
-    else:
-        filters = []
-        if brand:
-            # CORRECTION: brand est keyword, donc pas de .keyword
-            filters.append({"term": {"brand": brand}})
-        if category:
-            filters.append({"term": {"category": category}})
-
-        query_body["query"]["bool"]["filter"] = filters
-        query_body["query"]["bool"]["must"] = [{"match_all": {}}]
+    # Filtrage des champs si spécifié, fait par Elasticsearch (_source)
+    if fields:
+        query_body["_source"] = list(fields)
 
     # Exécution de la requête
     try:
         res = es.search(index=ES_INDEX, body=query_body)
-        hits = [hit["_source"] for hit in res["hits"]["hits"]]
-
-        # Filtrage des champs si spécifié
-        if fields:
-            hits = [{k: v for k, v in hit.items() if k in fields} for hit in hits]
-
-        return hits
+        return [hit["_source"] for hit in res["hits"]["hits"]]
 
     except Exception as e:
-        print(f"Erreur lors de la recherche: {e}")
+        logger.error("Erreur lors de la recherche: %s", e)
         return []
 
 
@@ -287,14 +356,11 @@ def __get_products_by_ids(ids: list):
     if not ids:
         return []
 
-    # sanitize and deduplicate ids while preserving order
-    seen = set()
-    ordered_ids = []
-    for i in ids:
-        sid = str(i).strip()
-        if sid and sid not in seen:
-            seen.add(sid)
-            ordered_ids.append(sid)
+    # sanitize and deduplicate ids while preserving order (dict keys keep
+    # insertion order), then drop the empty id
+    unique_ids = dict.fromkeys([str(i).strip() for i in ids])
+    unique_ids.pop("", None)
+    ordered_ids = list(unique_ids)
 
     # _source filtering
     mget_body = {"ids": ordered_ids}
@@ -307,7 +373,7 @@ def __get_products_by_ids(ids: list):
         return [hits[i] for i in ordered_ids if i in hits]
 
     except Exception as e:
-        print(f"Error fetching products by ids: {e}")
+        logger.error("Error fetching products by ids: %s", e)
         return []
 
 
@@ -316,12 +382,9 @@ def __get_product_categories():
     Retrieve product categories from data_store.json
     """
     try:
-        with open(
-            "api_navimall/assets/json/data_store.json", "r", encoding="utf-8"
-        ) as f:
-            data = json.load(f)
-            categories = data.get("categories", [])
-            return categories
+        data = _load_json_cached(DATA_STORE_JSON_PATH)
+        categories = data.get("categories", [])
+        return categories
     except Exception as e:
-        print(f"Error fetching product categories: {e}")
+        logger.error("Error fetching product categories: %s", e)
         return []
@@ -1,8 +1,13 @@
 # crud stands for Create, Read, Update, Delete
+import hashlib
 import logging
 import os
+import shutil
+from functools import lru_cache
+from typing import Optional
+import numpy as np
 from fastapi import HTTPException, UploadFile
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 
 from api_navimall.models import PathOptimizationRequest, PathOptimizationResponse
 from api_navimall.path_optimization import (
@@ -20,11 +25,186 @@ from api_navimall.path_optimization.serialization_utils import (
     clean_poi_summary,
 )
 from api_navimall.path_optimization.utils import grid_to_real_world_coords
-
+from api_navimall.path_optimization.store_layout_manager import DEFAULT_CACHE_DIR
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+SVG_CACHE_CONTROL = "public, max-age=300"
+
+
+@lru_cache(maxsize=4)
+def _load_layout_cached(path: str, mtime: float):
+    """Load a layout once per (path, mtime); the grid is returned read-only."""
+    layout, edge_length, meta = load_layout_from_h5(path)
+    layout.setflags(write=False)
+    return layout, edge_length, meta
+
+
+def _load_layout(path: str):
+    """Load a layout through the cache, reloading it if the file changed."""
+    return _load_layout_cached(path, os.path.getmtime(path))
+
+
+def _poi_coords_array(poi_coordinates) -> np.ndarray:
+    """Pack request POIs into a preallocated (N, 2) float64 array of (x, y)."""
+    coords = np.empty((len(poi_coordinates), 2), dtype=np.float64)
+    for i, poi in enumerate(poi_coordinates):
+        coords[i, 0] = poi.x
+        coords[i, 1] = poi.y
+    return coords
+
+
+# Pairwise POI paths cache: one subdirectory per layout hash, only the current
+# layout is kept and each one holds at most PATH_CACHE_MAX_ENTRIES files (LRU)
+PATH_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    DEFAULT_CACHE_DIR,
+    "paths",
+)
+PATH_CACHE_MAX_ENTRIES = 256
+
+
+def _path_cache_key(solver, layout_hash: str) -> str:
+    """blake2b key of every input compute_all_paths() depends on."""
+    # POI order matters: matrix indices follow poi_coords, so they are not sorted
+    poi_coords = tuple((int(r), int(c)) for r, c in solver.poi_coords)
+    return hashlib.blake2b(
+        repr(
+            (
+                layout_hash,
+                poi_coords,
+                float(solver.distance_threshold),
+                solver.algorithm,
+                solver.diagonal_movement,
+            )
+        ).encode(),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _save_cached_paths(cache_path: str, distance_matrix, path_matrix, stats: dict):
+    """Write the matrices as plain arrays (no pickle): paths are concatenated."""
+    flat_paths = [path for row in path_matrix for path in row]
+    present = np.array([path is not None for path in flat_paths], dtype=bool)
+    lengths = np.array(
+        [len(path) if path else 0 for path in flat_paths], dtype=np.int64
+    )
+    points = np.array(
+        [point for path in flat_paths if path for point in path], dtype=np.int64
+    ).reshape(-1, 2)
+    counts = np.array(
+        [
+            stats.get("total_paths_computed", 0),
+            stats.get("total_paths_failed", 0),
+            stats.get("paths_skipped_threshold", 0),
+        ],
+        dtype=np.int64,
+    )
+
+    tmp_path = f"{cache_path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(
+            f,
+            distance_matrix=distance_matrix,
+            present=present,
+            offsets=np.concatenate(([0], np.cumsum(lengths))),
+            points=points,
+            counts=counts,
+        )
+    os.replace(tmp_path, cache_path)
+
+
+def _load_cached_paths(cache_path: str, n_pois: int):
+    """Read a file written by _save_cached_paths; raises if it is invalid."""
+    with np.load(cache_path, allow_pickle=False) as data:
+        distance_matrix = data["distance_matrix"]
+        present = data["present"]
+        offsets = data["offsets"]
+        points = data["points"].tolist()
+        counts = data["counts"].tolist()
+
+    if distance_matrix.shape != (n_pois, n_pois) or present.shape != (n_pois**2,):
+        raise ValueError("cached matrices do not match the POI count")
+
+    path_matrix = [[None] * n_pois for _ in range(n_pois)]
+    for k in np.flatnonzero(present).tolist():
+        i, j = divmod(k, n_pois)
+        path_matrix[i][j] = [tuple(p) for p in points[offsets[k] : offsets[k + 1]]]
+    return distance_matrix, path_matrix, counts
+
+
+def _prune_path_cache(layout_dir: str) -> None:
+    """Drop caches of previous layouts and the least recently used entries."""
+    for name in os.listdir(PATH_CACHE_DIR):
+        other = os.path.join(PATH_CACHE_DIR, name)
+        if other != layout_dir and os.path.isdir(other):
+            shutil.rmtree(other, ignore_errors=True)
+
+    entries = [
+        entry
+        for entry in os.scandir(layout_dir)
+        if entry.is_file() and entry.name.endswith(".npz")
+    ]
+    if len(entries) > PATH_CACHE_MAX_ENTRIES:
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[: len(entries) - PATH_CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def _compute_all_paths_cached(solver, layout_hash: str):
+    """
+    Return solver.compute_all_paths(), reusing the matrices stored under
+    PATH_CACHE_DIR/{layout_hash}/ when the same inputs were already solved.
+    """
+    layout_dir = os.path.join(PATH_CACHE_DIR, layout_hash)
+    cache_path = os.path.join(
+        layout_dir, f"paths_{_path_cache_key(solver, layout_hash)}.npz"
+    )
+
+    try:
+        distance_matrix, path_matrix, counts = _load_cached_paths(
+            cache_path, len(solver.poi_coords)
+        )
+    except FileNotFoundError:
+        pass
+    except Exception as exc:
+        logger.warning("Ignoring unreadable path cache %s: %s", cache_path, exc)
+        try:
+            os.remove(cache_path)
+        except OSError:
+            pass
+    else:
+        # Recently used entries are evicted last
+        os.utime(cache_path)
+        computed, failed, skipped = counts
+        solver.stats.update(
+            {
+                "total_paths_computed": computed,
+                "total_paths_failed": failed,
+                "paths_skipped_threshold": skipped,
+                "total_algorithm_time": 0.0,
+                "path_cache_hit": True,
+            }
+        )
+        logger.info("Reusing cached paths %s", cache_path)
+        return distance_matrix, path_matrix
+
+    distance_matrix, path_matrix = solver.compute_all_paths()
+    solver.stats["path_cache_hit"] = False
+
+    try:
+        os.makedirs(layout_dir, exist_ok=True)
+        _save_cached_paths(cache_path, distance_matrix, path_matrix, solver.stats)
+        _prune_path_cache(layout_dir)
+    except OSError as exc:
+        logger.warning("Could not write path cache %s: %s", cache_path, exc)
+
+    return distance_matrix, path_matrix
+
 
 async def _upload_store_layout(layout_file: UploadFile, user_info: dict):
     """Upload store layout HDF5 file using StoreLayoutManager logic."""
@@ -48,7 +228,7 @@ def _get_current_layout_svg_infos(user_info: dict):
     return StoreLayoutManager.get_current_svg_info()
 
 
-def _get_current_layout_svg_file(user_info: dict):
+def _get_current_layout_svg_file(user_info: dict, if_none_match: Optional[str] = None):
     """Return the current layout SVG file as a streamed response."""
     info = StoreLayoutManager.get_current_svg_info()
     if not info.get("success"):
@@ -57,10 +237,30 @@ def _get_current_layout_svg_file(user_info: dict):
         )
 
     svg_path = info.get("svg_path")
-    if not svg_path or not os.path.exists(svg_path):
+    if not svg_path:
+        raise HTTPException(status_code=404, detail="SVG file not found")
+    try:
+        # Handed to FileResponse so it does not stat the file again
+        stat_result = os.stat(svg_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="SVG file not found")
 
-    return FileResponse(svg_path, media_type="image/svg+xml")
+    # The SVG is named after the layout hash, which makes it a strong ETag
+    etag = f'"{info["layout_hash"]}"'
+    headers = {"Cache-Control": SVG_CACHE_CONTROL, "ETag": etag}
+    if if_none_match:
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    return FileResponse(
+        svg_path,
+        media_type="image/svg+xml",
+        stat_result=stat_result,
+        headers=headers,
+    )
 
 
 def _get_layout_status(user_info: dict):
@@ -83,15 +283,17 @@ def _get_layout_status(user_info: dict):
             }
 
         # Load layout info
-        layout, edge_length, _ = load_layout_from_h5(layout_file)
+        layout, edge_length, _ = _load_layout(layout_file)
+        # Cells are validated to {-1, 0, 1, 2}: one pass is enough
+        obstacles_count = int(np.count_nonzero(layout < 0))
 
         return {
             "layout_uploaded": True,
             "layout_hash": current_layout_hash,
             "layout_shape": layout.shape,
             "edge_length": edge_length,
-            "obstacles_count": int((layout == -1).sum()),
-            "navigable_cells": int((layout >= 0).sum()),
+            "obstacles_count": obstacles_count,
+            "navigable_cells": int(layout.size) - obstacles_count,
             "cache_available": os.path.exists(
                 os.path.join("assets/cache", f"{current_layout_hash}.pkl")
             ),
@@ -126,12 +328,12 @@ def _optimize_shopping_path(request: PathOptimizationRequest, user_info: dict):
         )
 
     try:
-        layout, edge_length, _ = load_layout_from_h5(layout_path)
+        layout, edge_length, zones = _load_layout(layout_path)
     except Exception as exc:
         logger.error("Failed to load layout: %s", exc)
         raise HTTPException(status_code=500, detail="Invalid store layout file")
 
-    poi_coords_real = [(poi.x, poi.y) for poi in request.poi_coordinates]
+    poi_coords_real = _poi_coords_array(request.poi_coordinates)
     if len(poi_coords_real) < 2:
         raise HTTPException(
             status_code=422,
@@ -152,7 +354,7 @@ def _optimize_shopping_path(request: PathOptimizationRequest, user_info: dict):
     grid_with_poi, distance_threshold_grid = poi_mapper.generate_grid()
     poi_grid_coords = poi_mapper.get_poi_grid_coordinates()
 
-    layout_hash, _ = layout_manager.update_svg_if_needed(layout_path)
+    layout_hash, _ = layout_manager.update_svg_if_needed(layout_path, zones=zones)
 
     try:
         solver = PathfindingSolverFactory.create_solver(
@@ -185,7 +387,7 @@ def _optimize_shopping_path(request: PathOptimizationRequest, user_info: dict):
             diagonal_movement=request.diagonal_movement,
         )
 
-    distance_matrix, path_matrix = solver.compute_all_paths()
+    distance_matrix, path_matrix = _compute_all_paths_cached(solver, layout_hash)
 
     tsp_solver = TSPSolver(distance_matrix, max_runtime=request.max_runtime)
     visiting_order = tsp_solver.solve()
@@ -204,8 +406,6 @@ def _optimize_shopping_path(request: PathOptimizationRequest, user_info: dict):
 
     # Convert grid path to real-world coordinates using centralized utils
     try:
-        import numpy as np
-
         # complete_path is a list of (row, col); convert in batch for consistency
         complete_path_array = np.array(complete_path, dtype=float).reshape(-1, 2)
         complete_path_real_array = grid_to_real_world_coords(
@@ -241,8 +441,10 @@ def _optimize_shopping_path(request: PathOptimizationRequest, user_info: dict):
         "complete_path": complete_path_real,
         "poi_count": len(poi_coords_real),
         "computation_time": float(computation_time),
+        "layout_hash": layout_hash,
         "optimization_stats": optimization_stats,
         "path_summary": path_summary,
+        "generated_layout_svg": layout_manager.last_svg_updated,
     }
 
     cleaned_response = clean_optimization_response(response_data)
@@ -264,10 +466,10 @@ def _validate_poi_placement(request: PathOptimizationRequest, user_info: dict):
             raise HTTPException(status_code=422, detail="No store layout uploaded")
 
         layout_file = os.path.join("assets/layouts", f"{current_hash}.h5")
-        layout, edge_length, _ = load_layout_from_h5(layout_file)
+        layout, edge_length, _ = _load_layout(layout_file)
 
         # Convert POI coordinates
-        poi_coords_real = [(poi.x, poi.y) for poi in request.poi_coordinates]
+        poi_coords_real = _poi_coords_array(request.poi_coordinates)
 
         # Validate POI placement
         poi_mapper = POIMapper(
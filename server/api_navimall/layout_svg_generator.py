@@ -1,6 +1,6 @@
 import h5py
 import numpy as np
-import json
+import orjson
 import os
 import xxhash
 import datetime
@@ -65,6 +65,31 @@ class LayoutSVGGenerator:
         # Load layout data using the reference function
         layout_array, edge_length, zones = load_layout_from_h5(h5_filename)
 
+        return self.generate_svg(
+            layout_array, edge_length, zones, output_svg_path, include_metadata
+        )
+
+    def generate_svg(
+        self,
+        layout_array: np.ndarray,
+        edge_length: float,
+        zones: Dict[str, Zone],
+        output_svg_path: str,
+        include_metadata: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Generate interactive SVG from an already loaded layout.
+
+        Args:
+            layout_array: Store layout grid
+            edge_length: Cell edge length in cm
+            zones: Zones loaded alongside the layout
+            output_svg_path: Path where SVG will be saved
+            include_metadata: Whether to include JSON metadata
+
+        Returns:
+            Dictionary with generation metadata and statistics
+        """
         # Calculate SVG dimensions
         height, width = layout_array.shape
         # Match solver convention: x derives from row (height), y derives from col (width)
@@ -856,8 +881,17 @@ class LayoutSVGGenerator:
         """Save metadata to JSON file."""
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        # orjson: UTF-8 output like ensure_ascii=False, NumPy scalars/arrays
+        # encoded natively, int keys (cell_distribution) written as strings
+        with open(output_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    metadata,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
 
         logger.info(f"📄 Metadata saved to: {output_path}")
 
@@ -879,3 +913,29 @@ def generate_svg_from_h5(
     """
     generator = LayoutSVGGenerator()
     return generator.load_and_generate_svg(h5_path, output_svg_path, include_metadata)
+
+
+def generate_svg_from_layout(
+    layout_array: np.ndarray,
+    edge_length: float,
+    zones: Dict[str, Zone],
+    output_svg_path: str,
+    include_metadata: bool = True,
+) -> Dict[str, Any]:
+    """
+    Convenience function to generate SVG from a layout already in memory.
+
+    Args:
+        layout_array: Store layout grid
+        edge_length: Cell edge length in cm
+        zones: Zones loaded alongside the layout
+        output_svg_path: Path where SVG will be saved
+        include_metadata: Whether to generate metadata JSON file
+
+    Returns:
+        Dictionary with generation statistics and file paths
+    """
+    generator = LayoutSVGGenerator()
+    return generator.generate_svg(
+        layout_array, edge_length, zones, output_svg_path, include_metadata
+    )
@@ -10,6 +10,7 @@ from api_navimall.crud import (
     reindex_products,
     _upload_store_layout,
 )
+from api_navimall.config import REINDEX_ON_BOOT
 from api_navimall.utils import file_to_upload_file
 
 logging.basicConfig(level=logging.INFO)
@@ -36,8 +37,10 @@ async def init_layout():
 
     create_index_if_missing()
 
-    # TODO: Dirty solution to reset the index during development to match changes in products.json. Implement a better strategy later to prevent Downtime.
-    reindex_products()
+    # Development: reload products.json to pick up catalogue changes (the alias swap
+    # in reindex_products avoids downtime). Opt-in with NAVIMALL_REINDEX_ON_BOOT=1
+    if REINDEX_ON_BOOT:
+        reindex_products()
     # We could also use delete index in developer mode using : `Invoke-RestMethod -Method Delete -Uri "http://localhost:9200/products"`
 
     return True
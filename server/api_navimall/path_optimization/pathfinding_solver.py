@@ -49,6 +49,7 @@ class PathfindingSolver:
         poi_coords: np.ndarray,
         algorithm: str = "astar",
         diagonal_movement: bool = True,
+        walkable_matrix: Optional[np.ndarray] = None,
     ):
         """
         Initialize pathfinding solver.
@@ -59,6 +60,8 @@ class PathfindingSolver:
             poi_coords: POI coordinates in grid space
             algorithm: Algorithm to use ('astar', 'dijkstra', 'best_first')
             diagonal_movement: Allow diagonal movements
+            walkable_matrix: Optional precomputed walkable mask of grid_with_poi
+                (cells equal to 0 or 1), reused instead of being recomputed
         """
         self.grid_array = grid_with_poi
         self.distance_threshold = distance_threshold_grid
@@ -67,6 +70,15 @@ class PathfindingSolver:
         self.algorithm = algorithm
         self.diagonal_movement = diagonal_movement
 
+        # Walkability and the pathfinding Grid are built once per solver;
+        # find_path only resets node state between searches.
+        # Only cells with values 0 (navigable) and 1 (POI) are walkable
+        # Cells with values -1 (obstacle) and 2 (shelf) are non-walkable
+        if walkable_matrix is None:
+            walkable_matrix = (grid_with_poi == 0) | (grid_with_poi == 1)
+        self.walkable_matrix = walkable_matrix
+        self.grid = Grid(matrix=self.walkable_matrix)
+
         self._create_finder()
 
         self.stats = {
@@ -120,14 +132,9 @@ class PathfindingSolver:
         try:
             start_time = time.time()
 
-            # Create a new grid for each search (clone() method doesn't exist)
-            # Recreate grid with same data
-            # Only cells with values 0 (navigable) and 1 (POI) are walkable
-            # Cells with values -1 (obstacle) and 2 (shelf) are non-walkable
-            walkable_matrix = ((self.grid_array == 0) | (self.grid_array == 1)).astype(
-                int
-            )
-            grid = Grid(matrix=walkable_matrix)
+            # Reuse the solver grid, clearing costs/parents left by the last search
+            grid = self.grid
+            grid.cleanup()
 
             # Get start and goal nodes
             # NOTE: pathfinding lib uses node(x, y) where x=col, y=row
@@ -271,6 +278,7 @@ class PathfindingSolver:
             "average_path_length": f"{self.stats['average_path_length']:.2f}",
             "total_computation_time": f"{self.stats['total_computation_time']:.3f}s",
             "total_algorithm_time": f"{self.stats.get('total_algorithm_time', 0):.3f}s",
+            "path_cache_hit": self.stats.get("path_cache_hit", False),
         }
 
     def get_pathfinding_info(self) -> Dict:
@@ -306,6 +314,7 @@ class PathfindingSolverFactory:
         poi_coords: np.ndarray,
         algorithm: str = "astar",
         diagonal_movement: bool = True,
+        walkable_matrix: Optional[np.ndarray] = None,
     ) -> PathfindingSolver:
         """
         Crée un solver pathfinding.
@@ -316,6 +325,7 @@ class PathfindingSolverFactory:
             poi_coords: Coordonnées POIs
             algorithm: Algorithme ('astar', 'dijkstra', 'best_first')
             diagonal_movement: Autoriser diagonales
+            walkable_matrix: Masque des cellules praticables précalculé (optionnel)
 
         Returns:
             PathfindingSolver configuré
@@ -326,6 +336,7 @@ class PathfindingSolverFactory:
             poi_coords=poi_coords,
             algorithm=algorithm,
             diagonal_movement=diagonal_movement,
+            walkable_matrix=walkable_matrix,
         )
 
     @staticmethod
@@ -5,7 +5,7 @@ Handles transformation of real-world coordinates to grid indices and POI integra
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import List, Tuple, Union
 import logging
 
 from .utils import real_world_to_grid_coords
@@ -24,7 +24,7 @@ class POIMapper:
         self,
         layout: np.ndarray,
         distance_threshold: float,
-        real_world_coords: List[Tuple[float, float]],
+        real_world_coords: Union[np.ndarray, List[Tuple[float, float]]],
         edge_length: float,
     ):
         """
@@ -33,12 +33,14 @@ class POIMapper:
         Args:
             layout: Original store layout numpy array
             distance_threshold: Distance threshold in real-world units
-            real_world_coords: List of POI coordinates in real-world frame
+            real_world_coords: POI coordinates in real-world frame, (N, 2) array or list
             edge_length: Size of one grid cell in centimeters
         """
         self.original_layout = layout.copy()
         self.distance_threshold = distance_threshold
-        self.real_world_coords = np.array(real_world_coords)
+        self.real_world_coords = np.asarray(
+            real_world_coords, dtype=np.float64
+        ).reshape(-1, 2)
         self.edge_length = edge_length
 
         logger.info(
@@ -79,13 +81,16 @@ class POIMapper:
         Raises:
             ValueError: If any POI conflicts with an obstacle
         """
-        for i, (x, y) in enumerate(grid_coords):
-            if self.original_layout[x, y] == -1:  # matrix[row, col]
-                real_coord = self.real_world_coords[i]
-                raise ValueError(
-                    f"POI at real-world coordinates {real_coord} "
-                    f"(grid: row={x}, col={y}) conflicts with an obstacle"
-                )
+        cells = self.original_layout[grid_coords[:, 0], grid_coords[:, 1]]
+        conflicts = np.flatnonzero(cells == -1)  # matrix[row, col]
+        if conflicts.size:
+            i = conflicts[0]
+            x, y = grid_coords[i]
+            real_coord = self.real_world_coords[i]
+            raise ValueError(
+                f"POI at real-world coordinates {real_coord} "
+                f"(grid: row={x}, col={y}) conflicts with an obstacle"
+            )
 
     def transform_coordinates(self) -> np.ndarray:
         """
@@ -98,7 +103,7 @@ class POIMapper:
             ValueError: If coordinates are invalid or conflict with obstacles
         """
         if len(self.real_world_coords) == 0:
-            return np.array([]).reshape(0, 2)
+            return np.empty((0, 2), dtype=int)
 
         # Convert to grid coordinates
         grid_coords = real_world_to_grid_coords(
@@ -142,8 +147,7 @@ class POIMapper:
         updated_grid = self.original_layout.copy()
 
         # Mark POIs in the grid
-        for x, y in grid_coords:
-            updated_grid[x, y] = 1  # Mark as point of interest (x=row, y=col)
+        updated_grid[grid_coords[:, 0], grid_coords[:, 1]] = 1  # (x=row, y=col)
 
         # Compute grid threshold
         distance_threshold_grid = self.compute_distance_threshold_grid()
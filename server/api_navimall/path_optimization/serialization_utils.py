@@ -7,6 +7,9 @@ Converts NumPy types to native Python types for proper JSON serialization.
 import numpy as np
 from typing import Any, Dict, List, Tuple, Union
 
+# Leaf types that are already JSON-safe and returned as-is
+_NATIVE_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 def convert_numpy_types(obj: Any) -> Any:
     """
@@ -18,7 +21,9 @@ def convert_numpy_types(obj: Any) -> Any:
     Returns:
         Object with NumPy types converted to Python types
     """
-    if isinstance(obj, np.integer):
+    if type(obj) in _NATIVE_TYPES:
+        return obj
+    elif isinstance(obj, np.integer):
         return int(obj)
     elif isinstance(obj, np.floating):
         return float(obj)
@@ -56,15 +61,16 @@ def clean_optimization_response(response_data: Dict[str, Any]) -> Dict[str, Any]
     Returns:
         Cleaned response dictionary with native Python types
     """
-    cleaned = convert_numpy_types(response_data)
-
-    # Specifically clean path coordinates if present
-    if "complete_path" in cleaned:
-        cleaned["complete_path"] = clean_path_coordinates(cleaned["complete_path"])
-
-    # Clean visiting order
-    if "visiting_order" in cleaned:
-        cleaned["visiting_order"] = [int(x) for x in cleaned["visiting_order"]]
+    cleaned = {}
+    for key, value in response_data.items():
+        # The path and visiting order are cleaned specifically (int() handles
+        # NumPy scalars), without a generic pass over the whole path first
+        if key == "complete_path":
+            cleaned[key] = clean_path_coordinates(value)
+        elif key == "visiting_order":
+            cleaned[key] = [int(x) for x in value]
+        else:
+            cleaned[key] = convert_numpy_types(value)
 
     return cleaned
 
@@ -79,12 +85,12 @@ def clean_poi_summary(summary: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Cleaned summary with native Python types
     """
-    cleaned = convert_numpy_types(summary)
-
-    # Specifically handle grid coordinates
-    if "grid_coords" in cleaned and cleaned["grid_coords"] is not None:
-        cleaned["grid_coords"] = [
-            [int(coord) for coord in point] for point in cleaned["grid_coords"]
-        ]
+    cleaned = {}
+    for key, value in summary.items():
+        # Specifically handle grid coordinates
+        if key == "grid_coords" and value is not None:
+            cleaned[key] = [[int(coord) for coord in point] for point in value]
+        else:
+            cleaned[key] = convert_numpy_types(value)
 
     return cleaned
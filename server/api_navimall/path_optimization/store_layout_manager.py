@@ -12,7 +12,10 @@ import logging
 
 from fastapi import UploadFile, HTTPException
 
-from api_navimall.layout_svg_generator import generate_svg_from_h5
+from api_navimall.layout_svg_generator import (
+    generate_svg_from_h5,
+    generate_svg_from_layout,
+)
 from .utils import load_layout_from_h5, save_hash_to_json, load_hash_from_json
 
 logger = logging.getLogger(__name__)
@@ -68,11 +71,12 @@ class StoreLayoutManager:
         Returns:
             Hexadecimal string representation of the hash
         """
-        # Convert numpy array to bytes for hashing
-        layout_bytes = self.layout.tobytes()
+        # Hash the layout buffer in place (same bytes as tobytes(), no copy
+        # when the array is already C-contiguous)
+        layout_buffer = np.ascontiguousarray(self.layout)
 
         # Compute XXH3 64-bit hash
-        hash_value = xxhash.xxh3_64(layout_bytes)
+        hash_value = xxhash.xxh3_64(layout_buffer)
         hash_hex = hash_value.hexdigest()
 
         logger.debug(f"Computed layout hash: {hash_hex}")
@@ -110,7 +114,11 @@ class StoreLayoutManager:
         return os.path.join(self.svg_assets_dir, f"{self.current_hash}.svg")
 
     def generate_svg_layout(
-        self, layout_path: str, svg_path: str, include_metadata: bool = True
+        self,
+        layout_path: Optional[str],
+        svg_path: str,
+        include_metadata: bool = True,
+        zones: Optional[Dict] = None,
     ) -> None:
         """
         Generate SVG representation of the store layout.
@@ -119,33 +127,58 @@ class StoreLayoutManager:
             layout_path: Path to the layout HDF5 file
             svg_path: Path to the generated SVG file
             include_metadata: Whether to generate metadata JSON file alongside SVG
+            zones: Zones loaded with self.layout; when given (with edge_length),
+                the SVG is built from memory instead of re-reading layout_path
         """
         logger.info(f"Generating SVG layout: {svg_path}")
 
-        generate_svg_from_h5(
-            layout_path, output_svg_path=svg_path, include_metadata=include_metadata
-        )
+        if zones is not None and self.edge_length is not None:
+            generate_svg_from_layout(
+                self.layout,
+                self.edge_length,
+                zones,
+                output_svg_path=svg_path,
+                include_metadata=include_metadata,
+            )
+        else:
+            if layout_path is None:
+                raise ValueError("Layout path is required to generate SVG assets")
+            generate_svg_from_h5(
+                layout_path,
+                output_svg_path=svg_path,
+                include_metadata=include_metadata,
+            )
 
         logger.info(f"SVG layout generated: {svg_path}")
 
     def update_svg_if_needed(
-        self, layout_path: Optional[str] = None, include_metadata: bool = True
+        self,
+        layout_path: Optional[str] = None,
+        include_metadata: bool = True,
+        zones: Optional[Dict] = None,
     ) -> Tuple[str, str]:
         """
         Update SVG if needed and return current hash and SVG path.
 
+        Args:
+            layout_path: Path to the layout HDF5 file (defaults to self.layout_path)
+            include_metadata: Whether to generate metadata JSON file alongside SVG
+            zones: Zones already loaded with self.layout, avoids re-reading the file
+
         Returns:
             Tuple of (current_hash, svg_path)
         """
         svg_path = self.get_svg_path()
 
         layout_source = layout_path or self.layout_path
-        if layout_source is None:
+        if layout_source is None and (zones is None or self.edge_length is None):
             raise ValueError("Layout path is required to generate SVG assets")
 
         if self.needs_svg_update() or not os.path.exists(svg_path):
             # Generate new SVG
-            self.generate_svg_layout(layout_source, svg_path, include_metadata)
+            self.generate_svg_layout(
+                layout_source, svg_path, include_metadata, zones=zones
+            )
             self.last_svg_updated = True
             logger.info("SVG updated successfully")
         else:
@@ -171,11 +204,15 @@ class StoreLayoutManager:
 
     @staticmethod
     def _compute_layout_statistics(layout: np.ndarray) -> Dict[str, int]:
+        # Cells are in {-1, 0, 1, 2}: shift by one and count them in a single pass
+        obstacles, navigable, pois, shelves = np.bincount(
+            layout.ravel() + 1, minlength=4
+        ).tolist()
         return {
-            "obstacles_count": int((layout == -1).sum()),
-            "navigable_cells": int((layout >= 0).sum()),
-            "poi_count": int((layout == 1).sum()),
-            "shelf_count": int((layout == 2).sum()),
+            "obstacles_count": obstacles,
+            "navigable_cells": navigable + pois + shelves,
+            "poi_count": pois,
+            "shelf_count": shelves,
         }
 
     @staticmethod
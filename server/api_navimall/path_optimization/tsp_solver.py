@@ -1,7 +1,10 @@
 """
-TSP Solver using Google OR-Tools for optimal route computation.
+TSP Solver using LKH (elkai) or Google OR-Tools for optimal route computation.
 
 Solves the Traveling Salesman Problem to find optimal visiting order.
+
+elkai is an optional dependency: LKH is free for academic and non-commercial
+use only, install it (pip install elkai) only where that licence applies.
 """
 
 import numpy as np
@@ -21,10 +24,21 @@ except ImportError:
     )
     ORTOOLS_AVAILABLE = False
 
+try:
+    import elkai
+
+    ELKAI_AVAILABLE = True
+except ImportError:
+    logger.info("elkai not available, LKH solver disabled")
+    ELKAI_AVAILABLE = False
+
+# Number of LKH runs (best tour is kept)
+LKH_RUNS = 10
+
 
 class TSPSolver:
     """
-    Solves the Traveling Salesman Problem using Google OR-Tools or fallback algorithm.
+    Solves the Traveling Salesman Problem using LKH, OR-Tools or a fallback algorithm.
 
     Computes optimal route visiting all points of interest.
     """
@@ -35,6 +49,7 @@ class TSPSolver:
         max_runtime: int = 60,
         solution_gap: float = 0.01,
         use_ortools: bool = True,
+        use_lkh: bool = True,
     ):
         """
         Initialize the TSP solver.
@@ -44,16 +59,24 @@ class TSPSolver:
             max_runtime: Maximum runtime in seconds
             solution_gap: Solution gap tolerance (0.01 = 1%)
             use_ortools: Whether to use OR-Tools (if available)
+            use_lkh: Whether to use the LKH heuristic through elkai (if available)
         """
         self.distance_matrix = distance_matrix
         self.max_runtime = max_runtime
         self.solution_gap = solution_gap
         self.use_ortools = use_ortools and ORTOOLS_AVAILABLE
+        self.use_lkh = use_lkh and ELKAI_AVAILABLE
         self.n_locations = len(distance_matrix)
 
+        if self.use_lkh:
+            solver_name = "LKH"
+        elif self.use_ortools:
+            solver_name = "OR-Tools"
+        else:
+            solver_name = "nearest neighbor"
         logger.info(
             f"Initialized TSP solver for {self.n_locations} locations, "
-            f"using {'OR-Tools' if self.use_ortools else 'nearest neighbor'}"
+            f"using {solver_name}"
         )
 
     def _validate_distance_matrix(self) -> None:
@@ -170,6 +193,44 @@ class TSPSolver:
         else:
             raise RuntimeError("OR-Tools failed to find a solution")
 
+    def solve_with_lkh(self) -> List[int]:
+        """
+        Solve TSP using the Lin-Kernighan-Helsgaun heuristic (elkai bindings).
+
+        Returns:
+            List of location indices representing the tour, starting at 0
+        """
+        logger.info("Solving TSP with LKH...")
+
+        if self.n_locations < 3:
+            return list(range(self.n_locations))
+
+        # Integer scaling as in the OR-Tools callback. An unreachable leg costs
+        # more than any tour made of reachable legs, whatever the layout size
+        finite = np.isfinite(self.distance_matrix)
+        scaled = self.distance_matrix * 1000
+        penalty = int(scaled[finite].max()) * self.n_locations + 1
+        int_matrix = np.where(finite, scaled, penalty).astype(np.int64)
+
+        # elkai takes no initial tour, so there is no nearest neighbor warm start:
+        # LKH builds and improves its own starting tours on each run
+        tour = elkai.DistanceMatrix(int_matrix.tolist()).solve_tsp(runs=LKH_RUNS)
+
+        # elkai returns a closed tour [0, ..., 0]
+        if len(tour) > self.n_locations and tour[0] == tour[-1]:
+            tour = tour[:-1]
+        start = tour.index(0)
+        route = [int(i) for i in tour[start:] + tour[:start]]
+
+        if sorted(route) != list(range(self.n_locations)):
+            raise RuntimeError("LKH returned an invalid tour")
+
+        logger.info(
+            f"LKH solution found: distance={self.compute_tour_distance(route):.2f}, "
+            f"route length={len(route)}"
+        )
+        return route
+
     def solve_with_nearest_neighbor(self, start_location: int = 0) -> List[int]:
         """
         Solve TSP using nearest neighbor heuristic.
@@ -228,18 +289,22 @@ class TSPSolver:
         """
         self._validate_distance_matrix()
 
-        try:
-            if self.use_ortools:
-                return self.solve_with_ortools()
-            else:
-                return self.solve_with_nearest_neighbor()
-        except Exception as e:
-            logger.warning(f"Primary TSP solver failed: {str(e)}, trying fallback")
-            # Fallback to nearest neighbor if OR-Tools fails
-            if self.use_ortools:
-                return self.solve_with_nearest_neighbor()
-            else:
-                raise RuntimeError(f"TSP solving failed: {str(e)}")
+        # Best first, nearest neighbor is the last resort
+        solvers = []
+        if self.use_lkh:
+            solvers.append(self.solve_with_lkh)
+        if self.use_ortools:
+            solvers.append(self.solve_with_ortools)
+        solvers.append(self.solve_with_nearest_neighbor)
+
+        for solver in solvers:
+            try:
+                return solver()
+            except Exception as e:
+                error = e
+                logger.warning(f"TSP solver {solver.__name__} failed: {str(e)}")
+
+        raise RuntimeError(f"TSP solving failed: {str(error)}")
 
     def compute_tour_distance(self, tour: List[int]) -> float:
         """
@@ -338,6 +403,8 @@ class TSPSolver:
             "solution_gap": self.solution_gap,
             "using_ortools": self.use_ortools,
             "ortools_available": ORTOOLS_AVAILABLE,
+            "using_lkh": self.use_lkh,
+            "elkai_available": ELKAI_AVAILABLE,
             "distance_matrix_shape": self.distance_matrix.shape,
             "finite_distances": int(np.sum(np.isfinite(self.distance_matrix))),
             "infinite_distances": int(np.sum(~np.isfinite(self.distance_matrix))),
@@ -12,6 +12,35 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Layout datasets are stored in chunks of at most LAYOUT_CHUNK_SIZE x LAYOUT_CHUNK_SIZE
+# cells, LZF-compressed with byte shuffling (cheap on CPU, good ratio on int grids)
+LAYOUT_CHUNK_SIZE = 256
+
+# File-level options for layout writes: latest file format and a 4 MiB chunk
+# cache (h5py's default is 1 MiB) so a full layout chunk stays cached
+H5_WRITE_OPTIONS = {
+    "libver": "latest",
+    "rdcc_nbytes": 4 * 1024 * 1024,
+    "rdcc_nslots": 521,
+}
+
+
+def layout_dataset_options(shape: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Return the h5py ``create_dataset`` storage options for a layout grid.
+
+    Args:
+        shape: (height, width) of the layout
+
+    Returns:
+        Keyword arguments for chunked, compressed storage
+    """
+    return {
+        "chunks": tuple(max(1, min(LAYOUT_CHUNK_SIZE, dim)) for dim in shape),
+        "compression": "lzf",
+        "shuffle": True,
+    }
+
 
 class Zone:
     """Represents a polygon zone in the store layout."""
@@ -56,7 +85,10 @@ def load_layout_from_h5(h5_filename: str) -> Tuple[np.ndarray, float, Dict[str,
             # Load the grid layout
             if "layout" not in f:
                 raise ValueError("Missing 'layout' dataset in HDF5 file")
-            layout = np.array(f["layout"])
+            # Read into a preallocated buffer (np.array(dataset) reads then copies)
+            layout_ds = f["layout"]
+            layout = np.empty(layout_ds.shape, dtype=layout_ds.dtype)
+            layout_ds.read_direct(layout)
 
             # Validate cell types
             valid_cells = {0, 1, -1, 2}  # navigable, POI, obstacle, shelf
@@ -112,12 +144,17 @@ def calculate_layout_hash(grid: np.ndarray, edge_length: float) -> str:
     Returns:
         Hexadecimal string representation of the hash
     """
-    # Convert grid to bytes and hash it along with edge_length
-    grid_bytes = grid.astype(np.uint8).tobytes()
-    edge_bytes = str(edge_length).encode("utf-8")
-    combined_data = grid_bytes + edge_bytes
+    # Stream the grid buffer (as uint8) then edge_length into XXH3: same digest
+    # as hashing grid_bytes + edge_bytes, without the tobytes()/concat copies
+    if grid.dtype.itemsize == 1:
+        grid_buffer = np.ascontiguousarray(grid).view(np.uint8)
+    else:
+        grid_buffer = np.ascontiguousarray(grid, dtype=np.uint8)
 
-    return xxhash.xxh3_64(combined_data).hexdigest()
+    hasher = xxhash.xxh3_64()
+    hasher.update(grid_buffer)
+    hasher.update(str(edge_length).encode("utf-8"))
+    return hasher.hexdigest()
 
 
 def save_layout_to_h5(
@@ -126,6 +163,7 @@ def save_layout_to_h5(
     edge_length: float,
     zones: Dict[str, Zone] = None,
     layout_hash: str = None,
+    attrs: Dict[str, Any] = None,
 ) -> None:
     """
     Save store layout, edge length, and zones to HDF5 file.
@@ -136,11 +174,15 @@ def save_layout_to_h5(
         edge_length: Size of one grid cell in centimeters
         zones: Dictionary of zones {zone_id: Zone}
         layout_hash: Optional hash for integrity verification
+        attrs: Optional file attributes (e.g. layout_hash, created_with), written
+            in the same open instead of reopening the file in append mode
     """
     try:
-        with h5py.File(h5_filename, "w") as f:
+        with h5py.File(h5_filename, "w", **H5_WRITE_OPTIONS) as f:
             # Save layout array
-            f.create_dataset("layout", data=layout, compression="gzip")
+            f.create_dataset(
+                "layout", data=layout, **layout_dataset_options(layout.shape)
+            )
 
             # Save edge length
             f.create_dataset("edge_length", data=edge_length)
@@ -149,6 +191,9 @@ def save_layout_to_h5(
             if layout_hash:
                 f.create_dataset("layout_hash", data=layout_hash.encode("utf-8"))
 
+            if attrs:
+                f.attrs.update(attrs)
+
             # Save zones if provided
             if zones:
                 zones_group = f.create_group("zones")
@@ -210,13 +255,13 @@ def save_grid_with_metadata(
         edge_length=edge_length,
         zones=zones or {},
         layout_hash=layout_hash,
+        # Hash attribute for compatibility with grid editor
+        attrs={
+            "layout_hash": layout_hash,
+            "created_with": "NaviStore Automatic Grid Generator",
+        },
     )
 
-    # Add hash as attribute for compatibility with grid editor
-    with h5py.File(filepath, "a") as f:
-        f.attrs["layout_hash"] = layout_hash
-        f.attrs["created_with"] = "NaviStore Automatic Grid Generator"
-
     # Log save information
     logger.info(f"Grid saved to: {filepath}")
     logger.info(f"Grid shape: {grid.shape}")
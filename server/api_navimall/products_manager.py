@@ -1,4 +1,5 @@
 import json
+import orjson
 from anyio import Path
 from collections import defaultdict
 import random
@@ -30,9 +31,9 @@ class ProductsManager:
         self.products_titles_id_brand_index = defaultdict(list)
         for p in self.products:
             if "id" in p:
-                self.products_titles_id_brand_index[
-                    f"{p['title']}-{p['brand']}"
-                ].append(p["id"])
+                self.products_titles_id_brand_index[self.__product_key(p)].append(
+                    p["id"]
+                )
 
         self.products_index_by_id = {p["id"]: p for p in self.products if "id" in p}
 
@@ -43,9 +44,8 @@ class ProductsManager:
     def __load_existing_products(self):
         file_path = Path(self.json_path)
         if file_path.exists():
-            with open(file_path, "r", encoding="utf-8") as f:
-                products = json.load(f)
-                return products
+            with open(file_path, "rb") as f:
+                return orjson.loads(f.read())
         else:
             return []
 
@@ -60,20 +60,38 @@ class ProductsManager:
             next_product_id = data.get("next_product_id")
         return next_product_id
 
+    @staticmethod
+    def __product_key(product):
+        """(title, brand) key identifying a product."""
+        return (product.get("title"), product.get("brand"))
+
     def __is_existing_product(self, product):
         """Check if a product already exists in the products list based on title and brand."""
-        return (
-            f"{product.get('title')}-{product.get('brand')}"
-            in self.products_titles_id_brand_index
-        )
+        return self.__product_key(product) in self.products_titles_id_brand_index
 
     def __save_products(self):
         if self.next_product_id < self.next_product_id_at_init:
             raise ValueError(
                 "next_product_id cannot be less than its initial value, there is an issue in the code logic."
             )
-        with open(self.json_path, "w", encoding="utf-8") as f:
-            json.dump(self.products, f, ensure_ascii=False, indent=4)
+        # orjson writes UTF-8 directly (no ASCII escaping), like ensure_ascii=False.
+        # Products are written one by one, in the same layout as OPT_INDENT_2 on
+        # the whole list, so the full file is never built in memory
+        with open(self.json_path, "wb") as f:
+            if not self.products:
+                f.write(b"[]")
+                return
+            separator = b"[\n  "
+            for product in self.products:
+                f.write(separator)
+                # Safe: orjson escapes newlines inside strings
+                f.write(
+                    orjson.dumps(product, option=orjson.OPT_INDENT_2).replace(
+                        b"\n", b"\n  "
+                    )
+                )
+                separator = b",\n  "
+            f.write(b"\n]")
 
     def __update_data_store(self, key: str, value):
         try:
@@ -117,12 +135,12 @@ class ProductsManager:
         """Get duplicate product ids. Two products are considered duplicates if they have the same title and brand.
 
         Returns:
-            dict: A dictionary with titles as keys and a list of tuples (id, brand) as values.
+            dict: A dictionary with (title, brand) tuples as keys and the list of their ids as values.
         """
 
         resultat_filtre = {
-            title: ids
-            for title, ids in self.products_titles_id_brand_index.items()
+            key: ids
+            for key, ids in self.products_titles_id_brand_index.items()
             if len(ids) > 1
         }
 
@@ -131,27 +149,27 @@ class ProductsManager:
     def fetch_products_from_leclerc(self, html_file_path):
         from tools.leclerc_products_fetcher import LeclercProductsFetcher
 
-        products = LeclercProductsFetcher.fetch_products(html_file_path)
-
-        count_added_products = 0
+        # Products already in the catalogue are dropped as they are parsed,
+        # only the new ones are kept
+        added_products = []
 
-        for product in products:
+        for product in LeclercProductsFetcher.iter_products(html_file_path):
             if not self.__is_existing_product(product):
                 product["id"] = self.next_product_id
                 self.products.append(product)
-                self.products_titles_id_brand_index[
-                    f"{product['title']}-{product['brand']}"
-                ].append(product["id"])
+                self.products_titles_id_brand_index[self.__product_key(product)].append(
+                    product["id"]
+                )
                 self.products_index_by_id[product["id"]] = product
                 self.next_product_id += 1
-                count_added_products += 1
-        if count_added_products > 0:
-            print(f"Added {count_added_products} new products to {self.json_path}.")
+                added_products.append(product)
+        if added_products:
+            print(f"Added {len(added_products)} new products to {self.json_path}.")
             self.__save_products()
             self.__update_data_store("next_product_id", self.next_product_id)
         else:
             print(f"No new products to add from {html_file_path} to {self.json_path}.")
-        return products
+        return added_products
 
     def update_categories(self) -> set:
         categories = set()
@@ -4,9 +4,10 @@ Router for path optimization endpoints.
 Handles store layout upload, POI coordinates, and optimal path computation.
 """
 
-from fastapi import APIRouter, Depends, UploadFile, File
+from fastapi import APIRouter, Depends, UploadFile, File, Header
 from fastapi.responses import FileResponse
 import logging
+from typing import Optional
 
 from api_navimall.auth import verify_api_key, verify_write_rights
 from api_navimall.path_optimization import (
@@ -89,5 +90,8 @@ async def get_current_layout_svg(user_info: dict = Depends(verify_api_key)):
 
 
 @router.get("/layout_svg", response_class=FileResponse)
-async def get_current_layout_svg_file(user_info: dict = Depends(verify_api_key)):
-    return _get_current_layout_svg_file(user_info)
+async def get_current_layout_svg_file(
+    user_info: dict = Depends(verify_api_key),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    return _get_current_layout_svg_file(user_info, if_none_match)
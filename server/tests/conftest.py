@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Tests import the server packages (api_navimall, Tools) from the server directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Manual script querying a running API at import time, run it directly instead
+collect_ignore = ["test_product_search.py"]
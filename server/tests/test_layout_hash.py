@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+import xxhash
+
+from api_navimall.path_optimization.utils import calculate_layout_hash
+
+
+def baseline_hash(grid, edge_length):
+    """Digest of the original implementation, which hashed a concatenated copy."""
+    combined = grid.astype(np.uint8).tobytes() + str(edge_length).encode("utf-8")
+    return xxhash.xxh3_64(combined).hexdigest()
+
+
+@pytest.fixture
+def grid():
+    # Every cell type, obstacles (-1) included
+    return np.random.default_rng(0).integers(-1, 3, size=(30, 40))
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.int32, np.int8, np.uint8])
+@pytest.mark.parametrize("edge_length", [100.0, 50, 12.5])
+def test_same_digest_as_baseline(grid, dtype, edge_length):
+    typed = grid.astype(dtype)
+    assert calculate_layout_hash(typed, edge_length) == baseline_hash(
+        typed, edge_length
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.int8])
+def test_non_contiguous_grid(grid, dtype):
+    view = grid.astype(dtype).T[::2]
+    assert not view.flags.c_contiguous
+    assert calculate_layout_hash(view, 100.0) == baseline_hash(view, 100.0)
+
+
+def test_int64_and_int8_grids_share_a_digest(grid):
+    assert calculate_layout_hash(grid.astype(np.int64), 100.0) == calculate_layout_hash(
+        grid.astype(np.int8), 100.0
+    )
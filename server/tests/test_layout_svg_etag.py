@@ -0,0 +1,58 @@
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
+
+from api_navimall import crud_path_optimization
+from api_navimall.path_optimization import StoreLayoutManager
+
+LAYOUT_HASH = "0123456789abcdef"
+ETAG = f'"{LAYOUT_HASH}"'
+
+
+@pytest.fixture
+def svg_path(tmp_path, monkeypatch):
+    path = tmp_path / f"{LAYOUT_HASH}.svg"
+    path.write_text("<svg/>")
+    info = {"success": True, "layout_hash": LAYOUT_HASH, "svg_path": str(path)}
+    monkeypatch.setattr(
+        StoreLayoutManager, "get_current_svg_info", classmethod(lambda cls: info)
+    )
+    return path
+
+
+def get_svg(if_none_match=None):
+    return crud_path_optimization._get_current_layout_svg_file({}, if_none_match)
+
+
+def test_serves_file_with_etag(svg_path):
+    response = get_svg()
+    assert isinstance(response, FileResponse)
+    assert response.status_code == 200
+    assert response.headers["etag"] == ETAG
+    assert response.headers["cache-control"] == "public, max-age=300"
+    assert response.stat_result.st_size == svg_path.stat().st_size
+
+
+@pytest.mark.parametrize(
+    "if_none_match", [ETAG, f'W/"other", W/{ETAG}', f'"other", {ETAG}', "*"]
+)
+def test_matching_if_none_match_returns_304(svg_path, if_none_match):
+    response = get_svg(if_none_match)
+    assert not isinstance(response, FileResponse)
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == ETAG
+
+
+@pytest.mark.parametrize("if_none_match", ['"other"', LAYOUT_HASH, ""])
+def test_other_if_none_match_serves_file(svg_path, if_none_match):
+    response = get_svg(if_none_match)
+    assert isinstance(response, FileResponse)
+    assert response.status_code == 200
+
+
+def test_missing_svg_is_404(svg_path):
+    svg_path.unlink()
+    with pytest.raises(HTTPException) as exc:
+        get_svg()
+    assert exc.value.status_code == 404
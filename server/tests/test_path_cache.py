@@ -0,0 +1,117 @@
+import os
+
+import numpy as np
+import pytest
+
+from api_navimall import crud_path_optimization
+from api_navimall.path_optimization import PathfindingSolverFactory
+
+LAYOUT_HASH = "0123456789abcdef"
+
+
+@pytest.fixture(autouse=True)
+def path_cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "paths"
+    monkeypatch.setattr(crud_path_optimization, "PATH_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+@pytest.fixture
+def compute_calls(monkeypatch):
+    """Count the real compute_all_paths() runs."""
+    calls = []
+    original = crud_path_optimization.PathfindingSolverFactory.create_solver
+
+    def create_solver(**kwargs):
+        solver = original(**kwargs)
+        compute = solver.compute_all_paths
+
+        def counted():
+            calls.append(solver)
+            return compute()
+
+        solver.compute_all_paths = counted
+        return solver
+
+    monkeypatch.setattr(PathfindingSolverFactory, "create_solver", create_solver)
+    return calls
+
+
+def make_solver(poi_coords):
+    grid = np.zeros((8, 10), dtype=int)
+    grid[2:6, 4] = -1
+    for row, col in poi_coords:
+        grid[row, col] = 1
+    return PathfindingSolverFactory.create_solver(
+        grid_with_poi=grid,
+        distance_threshold_grid=20.0,
+        poi_coords=np.array(poi_coords),
+        algorithm="astar",
+        diagonal_movement=False,
+    )
+
+
+POIS = [(0, 0), (7, 9), (3, 2)]
+
+
+def test_miss_then_hit(compute_calls, path_cache_dir):
+    first = make_solver(POIS)
+    distances, paths = crud_path_optimization._compute_all_paths_cached(
+        first, LAYOUT_HASH
+    )
+    assert len(compute_calls) == 1
+    assert first.get_optimization_stats()["path_cache_hit"] is False
+    assert len(os.listdir(path_cache_dir / LAYOUT_HASH)) == 1
+
+    second = make_solver(POIS)
+    cached_distances, cached_paths = crud_path_optimization._compute_all_paths_cached(
+        second, LAYOUT_HASH
+    )
+    assert len(compute_calls) == 1
+    np.testing.assert_array_equal(cached_distances, distances)
+    assert cached_paths == [
+        [None if path is None else [tuple(map(int, p)) for p in path] for path in row]
+        for row in paths
+    ]
+
+    stats = second.get_optimization_stats()
+    assert stats["path_cache_hit"] is True
+    assert stats["total_algorithm_time"] == "0.000s"
+    assert stats["paths_computed"] == first.get_optimization_stats()["paths_computed"]
+
+
+def test_poi_order_is_part_of_the_key(compute_calls):
+    crud_path_optimization._compute_all_paths_cached(make_solver(POIS), LAYOUT_HASH)
+    crud_path_optimization._compute_all_paths_cached(
+        make_solver(POIS[::-1]), LAYOUT_HASH
+    )
+    assert len(compute_calls) == 2
+
+
+def test_corrupt_file_is_recomputed(compute_calls, path_cache_dir):
+    distances, _ = crud_path_optimization._compute_all_paths_cached(
+        make_solver(POIS), LAYOUT_HASH
+    )
+    (cache_file,) = (path_cache_dir / LAYOUT_HASH).iterdir()
+    cache_file.write_bytes(b"not an npz file")
+
+    recomputed, _ = crud_path_optimization._compute_all_paths_cached(
+        make_solver(POIS), LAYOUT_HASH
+    )
+    assert len(compute_calls) == 2
+    np.testing.assert_array_equal(recomputed, distances)
+
+    # The corrupt entry was replaced by a valid one
+    crud_path_optimization._compute_all_paths_cached(make_solver(POIS), LAYOUT_HASH)
+    assert len(compute_calls) == 2
+
+
+def test_cache_is_bounded(monkeypatch, path_cache_dir):
+    monkeypatch.setattr(crud_path_optimization, "PATH_CACHE_MAX_ENTRIES", 2)
+    crud_path_optimization._compute_all_paths_cached(make_solver(POIS), "oldlayout")
+
+    for pois in (POIS, POIS[::-1], POIS[1:], POIS[:2]):
+        crud_path_optimization._compute_all_paths_cached(make_solver(pois), LAYOUT_HASH)
+
+    assert os.listdir(path_cache_dir) == [LAYOUT_HASH]
+    assert len(os.listdir(path_cache_dir / LAYOUT_HASH)) == 2
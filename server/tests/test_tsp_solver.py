@@ -0,0 +1,114 @@
+import types
+
+import numpy as np
+import pytest
+
+from api_navimall.path_optimization import tsp_solver
+from api_navimall.path_optimization.tsp_solver import TSPSolver
+
+
+def distance_matrix(n=7, seed=0):
+    points = np.random.default_rng(seed).random((n, 2)) * 100
+    return np.linalg.norm(points[:, None] - points[None], axis=-1)
+
+
+def fake_elkai(solve_tsp):
+    class DistanceMatrix:
+        def __init__(self, matrix):
+            self.matrix = matrix
+
+        def solve_tsp(self, runs):
+            return solve_tsp(self.matrix)
+
+    return types.SimpleNamespace(DistanceMatrix=DistanceMatrix)
+
+
+@pytest.fixture
+def no_elkai(monkeypatch):
+    monkeypatch.setattr(tsp_solver, "ELKAI_AVAILABLE", False)
+
+
+@pytest.fixture
+def no_ortools(monkeypatch):
+    monkeypatch.setattr(tsp_solver, "ORTOOLS_AVAILABLE", False)
+
+
+def assert_is_tour(route, n):
+    assert route[0] == 0
+    assert sorted(route) == list(range(n))
+
+
+def test_nearest_neighbor_when_no_solver_is_installed(no_elkai, no_ortools):
+    solver = TSPSolver(distance_matrix())
+    assert not solver.use_lkh and not solver.use_ortools
+
+    route = solver.solve()
+    assert_is_tour(route, 7)
+    assert route == solver.solve_with_nearest_neighbor()
+
+
+@pytest.mark.skipif(not tsp_solver.ORTOOLS_AVAILABLE, reason="OR-Tools not installed")
+def test_ortools_when_elkai_is_missing(no_elkai, monkeypatch):
+    solver = TSPSolver(distance_matrix(), max_runtime=1)
+    assert not solver.use_lkh and solver.use_ortools
+
+    calls = []
+    ortools = solver.solve_with_ortools
+    monkeypatch.setattr(
+        solver, "solve_with_ortools", lambda: calls.append(1) or ortools()
+    )
+    assert_is_tour(solver.solve(), 7)
+    assert calls == [1]
+
+
+def test_lkh_tour_is_normalised(no_ortools, monkeypatch):
+    monkeypatch.setattr(tsp_solver, "ELKAI_AVAILABLE", True)
+    monkeypatch.setattr(
+        tsp_solver,
+        "elkai",
+        fake_elkai(lambda matrix: [3, 1, 0, 2, 4, 5, 6, 3]),
+        raising=False,
+    )
+    assert TSPSolver(distance_matrix()).solve() == [0, 2, 4, 5, 6, 3, 1]
+
+
+def test_falls_back_when_lkh_fails(no_ortools, monkeypatch):
+    def fail(matrix):
+        raise RuntimeError("LKH crashed")
+
+    monkeypatch.setattr(tsp_solver, "ELKAI_AVAILABLE", True)
+    monkeypatch.setattr(tsp_solver, "elkai", fake_elkai(fail), raising=False)
+    solver = TSPSolver(distance_matrix())
+    assert solver.use_lkh
+
+    assert solver.solve() == solver.solve_with_nearest_neighbor()
+
+
+def test_falls_back_on_invalid_lkh_tour(no_ortools, monkeypatch):
+    monkeypatch.setattr(tsp_solver, "ELKAI_AVAILABLE", True)
+    monkeypatch.setattr(
+        tsp_solver, "elkai", fake_elkai(lambda matrix: [0, 1, 0]), raising=False
+    )
+    solver = TSPSolver(distance_matrix())
+    assert solver.solve() == solver.solve_with_nearest_neighbor()
+
+
+def test_unreachable_penalty_exceeds_any_reachable_tour(no_ortools, monkeypatch):
+    # Legs longer than 1000 units: a fixed 1e6 penalty would be cheaper
+    matrix = distance_matrix() * 1000
+    matrix[1, 2] = matrix[2, 1] = np.inf
+    seen = []
+
+    def solve_tsp(int_matrix):
+        seen.append(np.array(int_matrix))
+        return [0, 1, 3, 2, 4, 5, 6, 0]
+
+    monkeypatch.setattr(tsp_solver, "ELKAI_AVAILABLE", True)
+    monkeypatch.setattr(tsp_solver, "elkai", fake_elkai(solve_tsp), raising=False)
+    TSPSolver(matrix).solve()
+
+    (int_matrix,) = seen
+    finite = np.isfinite(matrix)
+    reachable_tour_bound = int_matrix[finite].max() * len(matrix)
+    assert int_matrix[1, 2] > reachable_tour_bound
+    assert int_matrix[2, 1] > reachable_tour_bound